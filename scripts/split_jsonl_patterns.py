@@ -17,10 +17,11 @@ from typing import Any, Dict
 DEFAULT_INPUT = "data/master_data/final_corpus_compact.jsonl"
 DEFAULT_OUTPUT_DIR = "data/master_data/patterns_json"
 DEFAULT_ID_FIELD = "id"
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
 
 
 def _sanitize_filename(value: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("_")
+    cleaned = UNSAFE_FILENAME_CHARS.sub("_", value).strip("_")
     return cleaned or "pattern"
 
 
@@ -6,20 +6,26 @@ conforming to the Universal Corpus XML schema.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, status, Query, Depends, UploadFile, File
-from fastapi.responses import JSONResponse, Response, StreamingResponse
-from typing import List, Optional, Dict, Any
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from fastapi import FastAPI, HTTPException, status, Query, Depends, UploadFile, File, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.exceptions import RequestValidationError
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from pathlib import Path
+from collections import OrderedDict
+from threading import Lock
 import json
 import csv
+import hashlib
 import io
 import re
+import orjson
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from universal_corpus.models import Pattern, CategoryType, StatusType
 from universal_corpus.database import get_db, init_db, PatternRepository
+from universal_corpus.cache import response_cache, TTL_SHORT, TTL_NORMAL, TTL_LONG
 from universal_corpus.compact_format import (
     pattern_to_compact,
     compact_to_pattern,
@@ -35,12 +41,63 @@ from universal_corpus.csv_compact import (
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
-    """Initialize database tables on application startup."""
+async def lifespan(app: FastAPI):
+    """Initialize database tables and warm the OpenAPI schema on application startup."""
     init_db()
+    # app.openapi() memoizes into app.openapi_schema; build it now rather than
+    # on the first /docs or /openapi.json request
+    app.openapi()
     yield
 
 
+def get_repo(db: Session = Depends(get_db)) -> PatternRepository:
+    """
+    Dependency function to get a pattern repository bound to the request session.
+    
+    FastAPI caches dependencies per request, so every consumer in one request
+    shares the same repository and session.
+    """
+    return PatternRepository(db)
+
+
+async def json_object_body(request: Request) -> Dict[str, Any]:
+    """
+    Dependency function to decode a JSON object request body with orjson.
+    
+    Used for free-form bodies that are merged rather than validated as a model,
+    so FastAPI's own stdlib json decoding is skipped. Errors are reported in
+    the same shape as FastAPI's body validation errors.
+    
+    Raises:
+        RequestValidationError: If the body is not valid JSON or not an object
+    """
+    body = await request.body()
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{
+                "type": "json_invalid",
+                "loc": ("body", e.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": e.msg}
+            }],
+            body=e.doc
+        )
+    if not isinstance(data, dict):
+        raise RequestValidationError(
+            [{
+                "type": "dict_type",
+                "loc": ("body",),
+                "msg": "Input should be a valid dictionary",
+                "input": data
+            }],
+            body=data
+        )
+    return data
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title="Universal Corpus Pattern API",
@@ -48,154 +105,434 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress bodies for clients that accept it; pattern listings and exports are
+# repetitive JSON/XML/CSV and shrink several-fold, small responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # Helper functions for XML conversion
-def pattern_to_xml(pattern: Pattern) -> str:
+#
+# The schema fixes the shape of a pattern document, so XML is rendered from
+# string templates rather than by building and serializing an element tree.
+# Output is indented with two spaces per level.
+_NS = "http://universal-corpus.org/schema/v1"
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+_COLLECTION_OPEN = f'<patterns xmlns="{_NS}">\n'
+_COLLECTION_CLOSE = "</patterns>\n"
+
+# Characters XML 1.0 cannot represent, even as character references
+_INVALID_XML_RANGES = "\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff"
+_INVALID_XML_CHARS = re.compile(f"[{_INVALID_XML_RANGES}]")
+# Anything that needs escaping or rejecting; most values contain none of it
+_TEXT_SPECIAL = re.compile(f"[&<>\r{_INVALID_XML_RANGES}]")
+_ATTR_SPECIAL = re.compile(f"[&<>\"\n\t\r{_INVALID_XML_RANGES}]")
+
+_PATTERN_TMPL = (
+    '<pattern xmlns="' + _NS + '" id="{id}" version="{version}">\n'
+    "  <metadata>\n"
+    "    <name>{name}</name>\n"
+    "    <category>{category}</category>\n"
+    "    <status>{status}</status>\n"
+    "{complexity}{domains}{last_updated}"
+    "  </metadata>\n"
+    "  <definition>\n"
+    "{tuple_notation}"
+    "    <components>\n"
+    "{components}"
+    "    </components>\n"
+    "{description}"
+    "  </definition>\n"
+    "{type_definitions}"
+    "  <properties>\n"
+    "{properties}"
+    "  </properties>\n"
+    "  <operations>\n"
+    "{operations}"
+    "  </operations>\n"
+    "{dependencies}"
+    "{manifestations}"
+    "</pattern>\n"
+)
+_COMPONENT_TMPL = (
+    "      <component>\n"
+    "        <name>{name}</name>\n"
+    "        <type>{type}</type>\n"
+    "{notation}"
+    "        <description>{description}</description>\n"
+    "      </component>\n"
+)
+_TYPE_DEF_TMPL = (
+    "    <type-def>\n"
+    "      <name>{name}</name>\n"
+    "{definition}"
+    "{description}"
+    "    </type-def>\n"
+)
+_PROPERTY_TMPL = (
+    '    <property id="{id}">\n'
+    "      <name>{name}</name>\n"
+    "{formal_spec}"
+    "{description}"
+    "{invariants}"
+    "    </property>\n"
+)
+_OPERATION_TMPL = (
+    "    <operation>\n"
+    "      <name>{name}</name>\n"
+    "      <signature>{signature}</signature>\n"
+    "{formal_definition}"
+    "{preconditions}"
+    "{postconditions}"
+    "{effects}"
+    "    </operation>\n"
+)
+_MANIFESTATION_TMPL = (
+    "    <manifestation>\n"
+    "      <name>{name}</name>\n"
+    "{description}"
+    "    </manifestation>\n"
+)
+
+
+def _text(value: str) -> str:
+    """Escape a string for use as element text."""
+    if _TEXT_SPECIAL.search(value) is None:
+        return value
+    if _INVALID_XML_CHARS.search(value):
+        raise ValueError(f"Value is not XML compatible: {value!r}")
+    return (
+        value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        .replace("\r", "&#13;")
+    )
+
+
+def _attr(value: str) -> str:
+    """Escape a string for use as a double-quoted attribute value."""
+    if _ATTR_SPECIAL.search(value) is None:
+        return value
+    if _INVALID_XML_CHARS.search(value):
+        raise ValueError(f"Value is not XML compatible: {value!r}")
+    return (
+        value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        .replace('"', "&quot;").replace("\n", "&#10;").replace("\t", "&#9;")
+        .replace("\r", "&#13;")
+    )
+
+
+def _leaf(indent: str, tag: str, value: str) -> str:
+    """Render a text-only element on its own line."""
+    return f"{indent}<{tag}>{_text(value)}</{tag}>\n"
+
+
+def _math(indent: str, tag: str, expr) -> str:
+    """Render a MathExpression as an element with a format attribute."""
+    return f'{indent}<{tag} format="{_attr(expr.format)}">{_text(expr.content)}</{tag}>\n'
+
+
+def _wrap(indent: str, tag: str, children: str) -> str:
+    """Render a container element around pre-rendered children."""
+    if not children:
+        return f"{indent}<{tag}/>\n"
+    return f"{indent}<{tag}>\n{children}{indent}</{tag}>\n"
+
+
+def pattern_to_xml(pattern: Pattern, xml_declaration: bool = True) -> str:
     """
     Convert a Pattern Pydantic model to XML string matching the XSD schema.
     
     Args:
         pattern: The pattern to convert
-        
+        xml_declaration: Whether to prepend the <?xml ...?> declaration
+    
     Returns:
         XML string representation
+    
+    Raises:
+        ValueError: If a value contains characters XML cannot represent
     """
-    # Create root element
-    root = ET.Element(
-        "pattern",
-        attrib={
-            "xmlns": "http://universal-corpus.org/schema/v1",
-            "id": pattern.id,
-            "version": pattern.version
-        }
+    metadata = pattern.metadata
+    definition = pattern.definition
+    
+    domains = ""
+    if metadata.domains:
+        domains = _wrap("    ", "domains", "".join(
+            _leaf("      ", "domain", domain) for domain in metadata.domains.domain
+        ))
+    
+    components = "".join(
+        _COMPONENT_TMPL.format(
+            name=_text(comp.name),
+            type=_text(comp.type),
+            notation=_leaf("        ", "notation", comp.notation) if comp.notation else "",
+            description=_text(comp.description)
+        )
+        for comp in definition.components.component
     )
     
-    # Metadata
-    metadata_elem = ET.SubElement(root, "metadata")
-    ET.SubElement(metadata_elem, "name").text = pattern.metadata.name
-    ET.SubElement(metadata_elem, "category").text = pattern.metadata.category
-    ET.SubElement(metadata_elem, "status").text = pattern.metadata.status
-    if pattern.metadata.complexity:
-        ET.SubElement(metadata_elem, "complexity").text = pattern.metadata.complexity
-    if pattern.metadata.domains:
-        domains_elem = ET.SubElement(metadata_elem, "domains")
-        for domain in pattern.metadata.domains.domain:
-            ET.SubElement(domains_elem, "domain").text = domain
-    if pattern.metadata.last_updated:
-        ET.SubElement(metadata_elem, "last-updated").text = pattern.metadata.last_updated
-    
-    # Definition
-    definition_elem = ET.SubElement(root, "definition")
-    tuple_notation = ET.SubElement(definition_elem, "tuple-notation")
-    tuple_notation.text = pattern.definition.tuple_notation.content
-    tuple_notation.set("format", pattern.definition.tuple_notation.format)
-    
-    components_elem = ET.SubElement(definition_elem, "components")
-    for comp in pattern.definition.components.component:
-        comp_elem = ET.SubElement(components_elem, "component")
-        ET.SubElement(comp_elem, "name").text = comp.name
-        ET.SubElement(comp_elem, "type").text = comp.type
-        if comp.notation:
-            ET.SubElement(comp_elem, "notation").text = comp.notation
-        ET.SubElement(comp_elem, "description").text = comp.description
-    
-    if pattern.definition.description:
-        ET.SubElement(definition_elem, "description").text = pattern.definition.description
-    
     # Type definitions (optional)
+    type_definitions = ""
     if pattern.type_definitions:
-        type_defs_elem = ET.SubElement(root, "type-definitions")
-        for typedef in pattern.type_definitions.type_def:
-            typedef_elem = ET.SubElement(type_defs_elem, "type-def")
-            ET.SubElement(typedef_elem, "name").text = typedef.name
-            definition = ET.SubElement(typedef_elem, "definition")
-            definition.text = typedef.definition.content
-            definition.set("format", typedef.definition.format)
-            if typedef.description:
-                ET.SubElement(typedef_elem, "description").text = typedef.description
-    
-    # Properties
-    properties_elem = ET.SubElement(root, "properties")
-    for prop in pattern.properties.property:
-        prop_elem = ET.SubElement(properties_elem, "property", attrib={"id": prop.id})
-        ET.SubElement(prop_elem, "name").text = prop.name
-        formal_spec = ET.SubElement(prop_elem, "formal-spec")
-        formal_spec.text = prop.formal_spec.content
-        formal_spec.set("format", prop.formal_spec.format)
-        if prop.description:
-            ET.SubElement(prop_elem, "description").text = prop.description
-        if prop.invariants:
-            invariants_elem = ET.SubElement(prop_elem, "invariants")
-            for inv in prop.invariants.invariant:
-                inv_elem = ET.SubElement(invariants_elem, "invariant")
-                inv_elem.text = inv.content
-                inv_elem.set("format", inv.format)
-    
-    # Operations
-    operations_elem = ET.SubElement(root, "operations")
-    for op in pattern.operations.operation:
-        op_elem = ET.SubElement(operations_elem, "operation")
-        ET.SubElement(op_elem, "name").text = op.name
-        ET.SubElement(op_elem, "signature").text = op.signature
-        formal_def = ET.SubElement(op_elem, "formal-definition")
-        formal_def.text = op.formal_definition.content
-        formal_def.set("format", op.formal_definition.format)
-        
-        if op.preconditions:
-            precond_elem = ET.SubElement(op_elem, "preconditions")
-            for cond in op.preconditions.condition:
-                cond_elem = ET.SubElement(precond_elem, "condition")
-                cond_elem.text = cond.content
-                cond_elem.set("format", cond.format)
-        
-        if op.postconditions:
-            postcond_elem = ET.SubElement(op_elem, "postconditions")
-            for cond in op.postconditions.condition:
-                cond_elem = ET.SubElement(postcond_elem, "condition")
-                cond_elem.text = cond.content
-                cond_elem.set("format", cond.format)
-        
-        if op.effects:
-            effects_elem = ET.SubElement(op_elem, "effects")
-            for effect in op.effects.effect:
-                ET.SubElement(effects_elem, "effect").text = effect
+        type_definitions = _wrap("  ", "type-definitions", "".join(
+            _TYPE_DEF_TMPL.format(
+                name=_text(typedef.name),
+                definition=_math("      ", "definition", typedef.definition),
+                description=(
+                    _leaf("      ", "description", typedef.description)
+                    if typedef.description else ""
+                )
+            )
+            for typedef in pattern.type_definitions.type_def
+        ))
+    
+    properties = "".join(
+        _PROPERTY_TMPL.format(
+            id=_attr(prop.id),
+            name=_text(prop.name),
+            formal_spec=_math("      ", "formal-spec", prop.formal_spec),
+            description=(
+                _leaf("      ", "description", prop.description) if prop.description else ""
+            ),
+            invariants=_wrap("      ", "invariants", "".join(
+                _math("        ", "invariant", inv) for inv in prop.invariants.invariant
+            )) if prop.invariants else ""
+        )
+        for prop in pattern.properties.property
+    )
+    
+    operations = "".join(
+        _OPERATION_TMPL.format(
+            name=_text(op.name),
+            signature=_text(op.signature),
+            formal_definition=_math("      ", "formal-definition", op.formal_definition),
+            preconditions=_wrap("      ", "preconditions", "".join(
+                _math("        ", "condition", cond) for cond in op.preconditions.condition
+            )) if op.preconditions else "",
+            postconditions=_wrap("      ", "postconditions", "".join(
+                _math("        ", "condition", cond) for cond in op.postconditions.condition
+            )) if op.postconditions else "",
+            effects=_wrap("      ", "effects", "".join(
+                _leaf("        ", "effect", effect) for effect in op.effects.effect
+            )) if op.effects else ""
+        )
+        for op in pattern.operations.operation
+    )
     
     # Dependencies (optional)
+    dependencies = ""
     if pattern.dependencies:
-        deps_elem = ET.SubElement(root, "dependencies")
-        if pattern.dependencies.requires:
-            requires_elem = ET.SubElement(deps_elem, "requires")
-            for ref in pattern.dependencies.requires.pattern_ref:
-                ET.SubElement(requires_elem, "pattern-ref").text = ref
-        if pattern.dependencies.uses:
-            uses_elem = ET.SubElement(deps_elem, "uses")
-            for ref in pattern.dependencies.uses.pattern_ref:
-                ET.SubElement(uses_elem, "pattern-ref").text = ref
-        if pattern.dependencies.specializes:
-            specializes_elem = ET.SubElement(deps_elem, "specializes")
-            for ref in pattern.dependencies.specializes.pattern_ref:
-                ET.SubElement(specializes_elem, "pattern-ref").text = ref
-        if pattern.dependencies.specialized_by:
-            specialized_by_elem = ET.SubElement(deps_elem, "specialized-by")
-            for ref in pattern.dependencies.specialized_by.pattern_ref:
-                ET.SubElement(specialized_by_elem, "pattern-ref").text = ref
+        deps = pattern.dependencies
+        dependencies = _wrap("  ", "dependencies", "".join(
+            _wrap("    ", tag, "".join(
+                _leaf("      ", "pattern-ref", ref) for ref in refs.pattern_ref
+            ))
+            for tag, refs in (
+                ("requires", deps.requires),
+                ("uses", deps.uses),
+                ("specializes", deps.specializes),
+                ("specialized-by", deps.specialized_by)
+            )
+            if refs
+        ))
     
     # Manifestations (optional)
+    manifestations = ""
     if pattern.manifestations:
-        manifestations_elem = ET.SubElement(root, "manifestations")
-        for manif in pattern.manifestations.manifestation:
-            manif_elem = ET.SubElement(manifestations_elem, "manifestation")
-            ET.SubElement(manif_elem, "name").text = manif.name
-            if manif.description:
-                ET.SubElement(manif_elem, "description").text = manif.description
+        manifestations = _wrap("  ", "manifestations", "".join(
+            _MANIFESTATION_TMPL.format(
+                name=_text(manif.name),
+                description=(
+                    _leaf("      ", "description", manif.description) if manif.description else ""
+                )
+            )
+            for manif in pattern.manifestations.manifestation
+        ))
+    
+    xml_content = _PATTERN_TMPL.format(
+        id=_attr(pattern.id),
+        version=_attr(pattern.version),
+        name=_text(metadata.name),
+        category=metadata.category,
+        status=metadata.status,
+        complexity=_leaf("    ", "complexity", metadata.complexity) if metadata.complexity else "",
+        domains=domains,
+        last_updated=(
+            _leaf("    ", "last-updated", metadata.last_updated) if metadata.last_updated else ""
+        ),
+        tuple_notation=_math("    ", "tuple-notation", definition.tuple_notation),
+        components=components,
+        description=(
+            _leaf("    ", "description", definition.description) if definition.description else ""
+        ),
+        type_definitions=type_definitions,
+        properties=properties,
+        operations=operations,
+        dependencies=dependencies,
+        manifestations=manifestations
+    )
+    if xml_declaration:
+        return _XML_DECLARATION + xml_content
+    return xml_content
+
+
+# Flush streamed XML in chunks of roughly this many characters
+XML_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def render_many_xml(
+    patterns: Iterable[Pattern],
+    chunk_size: int = XML_STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Render several patterns as one XML document under a <patterns> root.
+    
+    Pattern bodies are rendered without their own declaration; each keeps its
+    namespace declaration, so it is identical to the single-pattern rendering.
+    Output is yielded in chunks of roughly chunk_size characters, so a caller
+    streaming a large collection never holds more than one chunk.
+    
+    Args:
+        patterns: Patterns to render, in output order
+        chunk_size: Approximate number of characters per yielded chunk
+        
+    Yields:
+        Consecutive pieces of the XML document
+    """
+    buffer = [_XML_DECLARATION, _COLLECTION_OPEN]
+    size = 0
+    for pattern in patterns:
+        chunk = pattern_to_xml(pattern, xml_declaration=False)
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    buffer.append(_COLLECTION_CLOSE)
+    yield "".join(buffer)
+
+
+# (ETag, rendered XML) keyed by a digest of the stored pattern document,
+# evicted least-recently-used
+XML_CACHE_MAX_ENTRIES = 512
+_XML_CACHE: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+# Endpoints run in the threadpool, so cache bookkeeping is serialized
+_XML_CACHE_LOCK = Lock()
+
+
+def get_pattern_xml_cached(data: str) -> Tuple[str, str]:
+    """
+    Return the ETag and XML rendering of a stored pattern, cached by content.
+    
+    Both are pure functions of the stored document, so they are cached under
+    its digest. Any change to the pattern, including one written straight to
+    the database by the CLI, yields a new key; entries for old content simply
+    age out. A hit needs neither validation nor a JSON dump.
+    
+    Args:
+        data: Stored JSON document, as returned by PatternRepository.get_data()
+        
+    Returns:
+        Tuple of (ETag header value, XML string representation)
+    """
+    key = hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+    with _XML_CACHE_LOCK:
+        entry = _XML_CACHE.get(key)
+        if entry is not None:
+            _XML_CACHE.move_to_end(key)
+            return entry
+    
+    pattern = Pattern.model_validate_json(data)
+    etag = pattern_etag(pattern.model_dump_json(by_alias=True).encode())
+    entry = (etag, pattern_to_xml(pattern))
+    with _XML_CACHE_LOCK:
+        _XML_CACHE[key] = entry
+        if len(_XML_CACHE) > XML_CACHE_MAX_ENTRIES:
+            _XML_CACHE.popitem(last=False)
+    return entry
+
+
+def invalidate_pattern_caches() -> None:
+    """Drop cached data affected by a write to any pattern."""
+    response_cache.clear()
+
+
+def pattern_etag(content: bytes) -> str:
+    """
+    Build the weak ETag advertised for a pattern representation.
+    
+    The tag is a digest of the pattern's JSON serialization rather than its
+    version, since a PUT or PATCH can change content without bumping the
+    version. The JSON and XML views share it: both render the same content.
+    
+    Args:
+        content: The pattern's JSON serialization under its schema aliases
+        
+    Returns:
+        Weak ETag header value
+    """
+    digest = hashlib.blake2b(content, digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+_PATTERN_LIST_ADAPTER = TypeAdapter(List[Pattern])
+
+
+def pattern_json_response(
+    pattern: Pattern,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Serialize an already-validated pattern straight into a JSON response.
+    
+    Returning a Response skips FastAPI's response_model pass, which would dump
+    the model and validate it again before encoding. The route's
+    response_model still documents the schema.
+    
+    Args:
+        pattern: Pattern to serialize
+        status_code: HTTP status code
+        
+    Returns:
+        JSON response with the pattern under its schema aliases
+    """
+    return Response(
+        content=pattern.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+# Short shared-cache lifetime for single-pattern representations
+PATTERN_CACHE_CONTROL = "public, max-age=10"
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Answer a conditional GET when the client already holds the current version.
     
-    # Convert to pretty-printed string
-    xml_string = ET.tostring(root, encoding="unicode")
-    dom = minidom.parseString(xml_string)
-    return dom.toprettyxml(indent="  ")
+    Args:
+        request: Incoming request carrying an optional If-None-Match header,
+            either "*" or a comma-separated list of entity tags
+        etag: ETag of the current representation
+        
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    # Weak comparison (RFC 9110, 13.1.2): the W/ prefix is ignored
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": PATTERN_CACHE_CONTROL}
+        )
+    return None
 
 
 # API Endpoints
@@ -231,13 +568,15 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check(db: Session = Depends(get_db)):
+def health_check(repo: PatternRepository = Depends(get_repo)):
     """Health check endpoint."""
-    repo = PatternRepository(db)
-    return {
-        "status": "healthy",
-        "patterns_count": repo.count()
-    }
+    # Never answer from a stale entry: an unreachable database must surface here
+    return response_cache.get_or_compute(
+        ("health",),
+        TTL_SHORT,
+        lambda: {"status": "healthy", "patterns_count": repo.count()},
+        stale_on_error=False
+    )
 
 
 @app.post(
@@ -246,13 +585,13 @@ async def health_check(db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
     tags=["Patterns"]
 )
-async def create_pattern(pattern: Pattern, db: Session = Depends(get_db)):
+def create_pattern(pattern: Pattern, repo: PatternRepository = Depends(get_repo)):
     """
     Create a new pattern.
     
     Args:
         pattern: Pattern object conforming to the schema
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         The created pattern
@@ -260,9 +599,10 @@ async def create_pattern(pattern: Pattern, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If pattern ID already exists
     """
-    repo = PatternRepository(db)
     try:
-        return repo.create(pattern)
+        created = repo.create(pattern)
+        invalidate_pattern_caches()
+        return pattern_json_response(created, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -271,12 +611,12 @@ async def create_pattern(pattern: Pattern, db: Session = Depends(get_db)):
 
 
 @app.get("/patterns", response_model=List[Pattern], tags=["Patterns"])
-async def list_patterns(
+def list_patterns(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     List all patterns with optional filtering.
@@ -286,28 +626,100 @@ async def list_patterns(
         status_filter: Optional status filter
         limit: Maximum number of results
         offset: Pagination offset
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         List of patterns matching the filters
     """
-    repo = PatternRepository(db)
-    return repo.list(
-        category=category,
-        status=status_filter,
-        limit=limit,
-        offset=offset
+    # Cache the encoded body; hits then skip serialization entirely
+    content = response_cache.get_or_compute(
+        ("patterns", category, status_filter, limit, offset),
+        TTL_NORMAL,
+        lambda: _PATTERN_LIST_ADAPTER.dump_json(
+            repo.list(
+                category=category,
+                status=status_filter,
+                limit=limit,
+                offset=offset
+            ),
+            by_alias=True
+        )
     )
+    return Response(content=content, media_type="application/json")
+
+
+def stream_patterns(
+    repo: PatternRepository,
+    category: Optional[str] = None,
+    status: Optional[str] = None
+) -> Iterator[Pattern]:
+    """
+    Iterate patterns on behalf of a streaming response body.
+    
+    The request-scoped session is released before the body is sent, so the
+    cursor reopens a connection; close it again once iteration ends.
+    
+    Args:
+        repo: Pattern repository
+        category: Filter by category
+        status: Filter by status
+        
+    Yields:
+        Patterns matching filters
+    """
+    try:
+        yield from repo.iter(category=category, status=status)
+    finally:
+        repo.db.close()
+
+
+@app.get(
+    "/patterns.xml",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/xml": {}}}},
+    tags=["Patterns"]
+)
+async def list_patterns_xml(
+    category: Optional[CategoryType] = Query(None, description="Filter by category"),
+    status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
+    repo: PatternRepository = Depends(get_repo)
+):
+    """
+    Stream all patterns as a single XML document.
+    
+    Patterns are read from a server-side cursor and written one at a time,
+    so memory use does not grow with the size of the collection.
+    
+    Args:
+        category: Optional category filter
+        status_filter: Optional status filter
+        repo: Pattern repository
+        
+    Returns:
+        Streaming XML response with a <patterns> root element
+    """
+    # A plain iterator: Starlette drives it from the threadpool, so cursor reads
+    # never block the event loop, and 64 KiB chunks keep the hops infrequent
+    body = render_many_xml(stream_patterns(repo, category=category, status=status_filter))
+    return StreamingResponse(body, media_type="application/xml")
 
 
 @app.get("/patterns/{pattern_id}", response_model=Pattern, tags=["Patterns"])
-async def get_pattern(pattern_id: str, db: Session = Depends(get_db)):
+def get_pattern(
+    pattern_id: str,
+    request: Request,
+    repo: PatternRepository = Depends(get_repo)
+):
     """
     Get a specific pattern by ID.
     
+    Supports conditional requests: a matching If-None-Match header yields
+    304 Not Modified without a body.
+    
     Args:
         pattern_id: Pattern identifier
-        db: Database session
+        request: Incoming request
+        repo: Pattern repository
         
     Returns:
         The requested pattern
@@ -315,7 +727,6 @@ async def get_pattern(pattern_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If pattern not found
     """
-    repo = PatternRepository(db)
     pattern = repo.get_by_id(pattern_id)
     
     if not pattern:
@@ -324,17 +735,35 @@ async def get_pattern(pattern_id: str, db: Session = Depends(get_db)):
             detail=f"Pattern with ID '{pattern_id}' not found"
         )
     
-    return pattern
+    # Serialize once: the ETag is a digest of the very bytes sent as the body
+    content = pattern.model_dump_json(by_alias=True).encode()
+    etag = pattern_etag(content)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": PATTERN_CACHE_CONTROL}
+    )
 
 
 @app.get("/patterns/{pattern_id}/xml", tags=["Patterns"])
-async def get_pattern_xml(pattern_id: str, db: Session = Depends(get_db)):
+def get_pattern_xml(
+    pattern_id: str,
+    request: Request,
+    repo: PatternRepository = Depends(get_repo)
+):
     """
     Get a specific pattern as XML.
     
+    Supports conditional requests like get_pattern().
+    
     Args:
         pattern_id: Pattern identifier
-        db: Database session
+        request: Incoming request
+        repo: Pattern repository
         
     Returns:
         XML representation of the pattern
@@ -342,29 +771,39 @@ async def get_pattern_xml(pattern_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If pattern not found
     """
-    repo = PatternRepository(db)
-    pattern = repo.get_by_id(pattern_id)
+    data = repo.get_data(pattern_id)
     
-    if not pattern:
+    if data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pattern with ID '{pattern_id}' not found"
         )
     
-    xml_content = pattern_to_xml(pattern)
+    etag, xml_content = get_pattern_xml_cached(data)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
     
-    return Response(content=xml_content, media_type="application/xml")
+    return Response(
+        content=xml_content,
+        media_type="application/xml",
+        headers={"ETag": etag, "Cache-Control": PATTERN_CACHE_CONTROL}
+    )
 
 
 @app.put("/patterns/{pattern_id}", response_model=Pattern, tags=["Patterns"])
-async def update_pattern(pattern_id: str, pattern: Pattern, db: Session = Depends(get_db)):
+def update_pattern(
+    pattern_id: str,
+    pattern: Pattern,
+    repo: PatternRepository = Depends(get_repo)
+):
     """
     Update an existing pattern.
     
     Args:
         pattern_id: Pattern identifier
         pattern: Updated pattern object
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         The updated pattern
@@ -372,16 +811,15 @@ async def update_pattern(pattern_id: str, pattern: Pattern, db: Session = Depend
     Raises:
         HTTPException: If pattern not found or ID mismatch
     """
-    repo = PatternRepository(db)
-    
     try:
         updated_pattern = repo.update(pattern_id, pattern)
+        invalidate_pattern_caches()
         if not updated_pattern:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Pattern with ID '{pattern_id}' not found"
             )
-        return updated_pattern
+        return pattern_json_response(updated_pattern)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -389,11 +827,21 @@ async def update_pattern(pattern_id: str, pattern: Pattern, db: Session = Depend
         )
 
 
-@app.patch("/patterns/{pattern_id}", response_model=Pattern, tags=["Patterns"])
-async def partial_update_pattern(
+@app.patch(
+    "/patterns/{pattern_id}",
+    response_model=Pattern,
+    tags=["Patterns"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}}
+        }
+    }
+)
+def partial_update_pattern(
     pattern_id: str, 
-    update_data: dict,
-    db: Session = Depends(get_db)
+    update_data: Dict[str, Any] = Depends(json_object_body),
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Partially update an existing pattern.
@@ -428,7 +876,7 @@ async def partial_update_pattern(
     Args:
         pattern_id: Pattern identifier
         update_data: Dictionary with fields to update (partial)
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         The updated pattern
@@ -436,16 +884,15 @@ async def partial_update_pattern(
     Raises:
         HTTPException: If pattern not found or invalid update data
     """
-    repo = PatternRepository(db)
-    
     try:
         updated_pattern = repo.partial_update(pattern_id, update_data)
+        invalidate_pattern_caches()
         if not updated_pattern:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Pattern with ID '{pattern_id}' not found"
             )
-        return updated_pattern
+        return pattern_json_response(updated_pattern)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -454,20 +901,21 @@ async def partial_update_pattern(
 
 
 @app.delete("/patterns/{pattern_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Patterns"])
-async def delete_pattern(pattern_id: str, db: Session = Depends(get_db)):
+def delete_pattern(pattern_id: str, repo: PatternRepository = Depends(get_repo)):
     """
     Delete a pattern.
     
     Args:
         pattern_id: Pattern identifier
-        db: Database session
+        repo: Pattern repository
         
     Raises:
         HTTPException: If pattern not found
     """
-    repo = PatternRepository(db)
+    deleted = repo.delete(pattern_id)
+    invalidate_pattern_caches()
     
-    if not repo.delete(pattern_id):
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pattern with ID '{pattern_id}' not found"
@@ -477,13 +925,13 @@ async def delete_pattern(pattern_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/patterns/{pattern_id}/dependencies", tags=["Patterns"])
-async def get_pattern_dependencies(pattern_id: str, db: Session = Depends(get_db)):
+def get_pattern_dependencies(pattern_id: str, repo: PatternRepository = Depends(get_repo)):
     """
     Get all dependencies for a pattern.
     
     Args:
         pattern_id: Pattern identifier
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Dependencies information
@@ -491,7 +939,6 @@ async def get_pattern_dependencies(pattern_id: str, db: Session = Depends(get_db
     Raises:
         HTTPException: If pattern not found
     """
-    repo = PatternRepository(db)
     pattern = repo.get_by_id(pattern_id)
     
     if not pattern:
@@ -503,11 +950,22 @@ async def get_pattern_dependencies(pattern_id: str, db: Session = Depends(get_db
     return pattern.dependencies if pattern.dependencies else {}
 
 
+# \s covers \n and \r, so one substitution flattens line breaks too
+_CSV_WHITESPACE = re.compile(r'\s+')
+
+
+def _clean_csv_text(text: str) -> str:
+    """Remove newlines and normalize whitespace for CSV output."""
+    if not text:
+        return ""
+    return _CSV_WHITESPACE.sub(' ', text).strip()
+
+
 @app.get("/export/csv", tags=["Export"])
-async def export_patterns_csv(
+def export_patterns_csv(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Export all patterns to a comprehensive CSV file with complete details.
@@ -525,18 +983,12 @@ async def export_patterns_csv(
     Args:
         category: Optional category filter
         status_filter: Optional status filter
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         CSV file with complete pattern data (all nested details included)
     """
-    repo = PatternRepository(db)
-    patterns = repo.list(
-        category=category,
-        status=status_filter,
-        limit=10000,  # Get all patterns
-        offset=0
-    )
+    patterns = repo.iter(category=category, status=status_filter)
     
     # Create CSV in memory with proper quoting for fields containing special characters
     output = io.StringIO()
@@ -575,39 +1027,31 @@ async def export_patterns_csv(
         'manifestations'
     ])
     
-    # Helper function to clean text for CSV (remove newlines and normalize whitespace)
-    def clean_text(text: str) -> str:
-        """Remove newlines and normalize whitespace for CSV output."""
-        if not text:
-            return ""
-        # Replace newlines with spaces
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        # Normalize multiple spaces to single space
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-    
     # Write pattern data
     for pattern in patterns:
         # Pattern type based on ID prefix
         pattern_type = "concept" if pattern.id.startswith('C') else "flow" if pattern.id.startswith('F') else "pattern"
         
+        metadata = pattern.metadata
+        definition = pattern.definition
+        
         # Extract tuple notation (clean it)
-        tuple_notation = clean_text(pattern.definition.tuple_notation.content)
-        tuple_notation_format = pattern.definition.tuple_notation.format
+        tuple_notation = _clean_csv_text(definition.tuple_notation.content)
+        tuple_notation_format = definition.tuple_notation.format
         
         # Extract description (clean it)
-        definition_description = clean_text(pattern.definition.description or "")
+        definition_description = _clean_csv_text(definition.description or "")
         
         # Extract domains
-        domains = "; ".join(pattern.metadata.domains.domain) if pattern.metadata.domains else ""
+        domains = "; ".join(metadata.domains.domain) if metadata.domains else ""
         
         # Build components string with full details
         components_list = []
-        for comp in pattern.definition.components.component:
-            comp_str = f"{comp.name}[type: {clean_text(comp.type)}"
+        for comp in definition.components.component:
+            comp_str = f"{comp.name}[type: {_clean_csv_text(comp.type)}"
             if comp.notation:
-                comp_str += f", notation: {clean_text(comp.notation)}"
-            comp_str += f", desc: {clean_text(comp.description)}]"
+                comp_str += f", notation: {_clean_csv_text(comp.notation)}"
+            comp_str += f", desc: {_clean_csv_text(comp.description)}]"
             components_list.append(comp_str)
         components_str = " | ".join(components_list)
         
@@ -615,9 +1059,9 @@ async def export_patterns_csv(
         type_defs_list = []
         if pattern.type_definitions:
             for td in pattern.type_definitions.type_def:
-                td_str = f"{td.name}[def: {clean_text(td.definition.content)}, format: {td.definition.format}"
+                td_str = f"{td.name}[def: {_clean_csv_text(td.definition.content)}, format: {td.definition.format}"
                 if td.description:
-                    td_str += f", desc: {clean_text(td.description)}"
+                    td_str += f", desc: {_clean_csv_text(td.description)}"
                 td_str += "]"
                 type_defs_list.append(td_str)
         type_defs_str = " | ".join(type_defs_list)
@@ -625,11 +1069,11 @@ async def export_patterns_csv(
         # Build properties string with full details
         properties_list = []
         for prop in pattern.properties.property:
-            prop_str = f"{prop.id}:{prop.name}[spec: {clean_text(prop.formal_spec.content)}, format: {prop.formal_spec.format}"
+            prop_str = f"{prop.id}:{prop.name}[spec: {_clean_csv_text(prop.formal_spec.content)}, format: {prop.formal_spec.format}"
             if prop.description:
-                prop_str += f", desc: {clean_text(prop.description)}"
+                prop_str += f", desc: {_clean_csv_text(prop.description)}"
             if prop.invariants:
-                inv_list = [f"{clean_text(inv.content)}({inv.format})" for inv in prop.invariants.invariant]
+                inv_list = [f"{_clean_csv_text(inv.content)}({inv.format})" for inv in prop.invariants.invariant]
                 prop_str += f", invariants: {'; '.join(inv_list)}"
             prop_str += "]"
             properties_list.append(prop_str)
@@ -638,18 +1082,18 @@ async def export_patterns_csv(
         # Build operations string with full details
         operations_list = []
         for op in pattern.operations.operation:
-            op_str = f"{op.name}[sig: {clean_text(op.signature)}, def: {clean_text(op.formal_definition.content)}, format: {op.formal_definition.format}"
+            op_str = f"{op.name}[sig: {_clean_csv_text(op.signature)}, def: {_clean_csv_text(op.formal_definition.content)}, format: {op.formal_definition.format}"
             
             if op.preconditions:
-                precond_list = [f"{clean_text(cond.content)}({cond.format})" for cond in op.preconditions.condition]
+                precond_list = [f"{_clean_csv_text(cond.content)}({cond.format})" for cond in op.preconditions.condition]
                 op_str += f", preconditions: {'; '.join(precond_list)}"
             
             if op.postconditions:
-                postcond_list = [f"{clean_text(cond.content)}({cond.format})" for cond in op.postconditions.condition]
+                postcond_list = [f"{_clean_csv_text(cond.content)}({cond.format})" for cond in op.postconditions.condition]
                 op_str += f", postconditions: {'; '.join(postcond_list)}"
             
             if op.effects:
-                effects_cleaned = [clean_text(effect) for effect in op.effects.effect]
+                effects_cleaned = [_clean_csv_text(effect) for effect in op.effects.effect]
                 op_str += f", effects: {'; '.join(effects_cleaned)}"
             
             op_str += "]"
@@ -662,37 +1106,38 @@ async def export_patterns_csv(
         specializes_deps = ""
         specialized_by_deps = ""
         
-        if pattern.dependencies:
-            if pattern.dependencies.requires:
-                requires_deps = "; ".join(pattern.dependencies.requires.pattern_ref)
-            if pattern.dependencies.uses:
-                uses_deps = "; ".join(pattern.dependencies.uses.pattern_ref)
-            if pattern.dependencies.specializes:
-                specializes_deps = "; ".join(pattern.dependencies.specializes.pattern_ref)
-            if pattern.dependencies.specialized_by:
-                specialized_by_deps = "; ".join(pattern.dependencies.specialized_by.pattern_ref)
+        deps = pattern.dependencies
+        if deps:
+            if deps.requires:
+                requires_deps = "; ".join(deps.requires.pattern_ref)
+            if deps.uses:
+                uses_deps = "; ".join(deps.uses.pattern_ref)
+            if deps.specializes:
+                specializes_deps = "; ".join(deps.specializes.pattern_ref)
+            if deps.specialized_by:
+                specialized_by_deps = "; ".join(deps.specialized_by.pattern_ref)
         
         # Build manifestations string
         manifestations_list = []
         if pattern.manifestations:
             for manif in pattern.manifestations.manifestation:
-                manif_str = f"{clean_text(manif.name)}"
+                manif_str = f"{_clean_csv_text(manif.name)}"
                 if manif.description:
-                    manif_str += f"[{clean_text(manif.description)}]"
+                    manif_str += f"[{_clean_csv_text(manif.description)}]"
                 manifestations_list.append(manif_str)
         manifestations_str = " | ".join(manifestations_list)
         
         # Write row with all details
         writer.writerow([
             pattern.id,
-            pattern.metadata.name,
+            metadata.name,
             pattern_type,
-            pattern.metadata.category,
-            pattern.metadata.status,
-            pattern.metadata.complexity or "",
+            metadata.category,
+            metadata.status,
+            metadata.complexity or "",
             pattern.version,
             domains,
-            pattern.metadata.last_updated or "",
+            metadata.last_updated or "",
             tuple_notation,
             tuple_notation_format,
             definition_description,
@@ -720,10 +1165,10 @@ async def export_patterns_csv(
 
 
 @app.get("/export/jsonl", tags=["Export"])
-async def export_patterns_jsonl(
+def export_patterns_jsonl(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Export all patterns to JSONL (JSON Lines) format.
@@ -739,18 +1184,12 @@ async def export_patterns_jsonl(
     Args:
         category: Optional category filter
         status_filter: Optional status filter
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         JSONL file where each line is a complete pattern as JSON
     """
-    repo = PatternRepository(db)
-    patterns = repo.list(
-        category=category,
-        status=status_filter,
-        limit=10000,  # Get all patterns
-        offset=0
-    )
+    patterns = stream_patterns(repo, category=category, status=status_filter)
     
     # Generate JSONL content (one JSON object per line)
     def generate_jsonl():
@@ -770,10 +1209,10 @@ async def export_patterns_jsonl(
 
 
 @app.get("/export/compact", tags=["Export"])
-async def export_patterns_compact(
+def export_patterns_compact(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Export patterns to compact JSONL format optimized for AI/LLM consumption.
@@ -813,18 +1252,12 @@ async def export_patterns_compact(
     Args:
         category: Optional category filter
         status_filter: Optional status filter
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Compact JSONL file (one pattern per line)
     """
-    repo = PatternRepository(db)
-    patterns = repo.list(
-        category=category,
-        status=status_filter,
-        limit=10000,
-        offset=0
-    )
+    patterns = repo.iter(category=category, status=status_filter)
     
     # Generate compact JSONL
     compact_jsonl = export_compact_jsonl(patterns)
@@ -840,10 +1273,10 @@ async def export_patterns_compact(
 
 
 @app.get("/export/csv-compact", tags=["Export"])
-async def export_patterns_csv_compact(
+def export_patterns_csv_compact(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Export patterns to CSV Compact format (columnar with detail columns).
@@ -873,18 +1306,12 @@ async def export_patterns_csv_compact(
     Args:
         category: Optional category filter
         status_filter: Optional status filter
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         CSV file with complete pattern data
     """
-    repo = PatternRepository(db)
-    patterns = repo.list(
-        category=category,
-        status=status_filter,
-        limit=10000,
-        offset=0
-    )
+    patterns = repo.iter(category=category, status=status_filter)
     
     # Generate CSV
     csv_content = patterns_to_csv(patterns)
@@ -899,10 +1326,10 @@ async def export_patterns_csv_compact(
 
 
 @app.get("/export/csv-simple", tags=["Export"])
-async def export_patterns_csv_simple(
+def export_patterns_csv_simple(
     category: Optional[CategoryType] = Query(None, description="Filter by category"),
     status_filter: Optional[StatusType] = Query(None, alias="status", description="Filter by status"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Export patterns to simplified CSV format (no detail columns).
@@ -931,18 +1358,12 @@ async def export_patterns_csv_simple(
     Args:
         category: Optional category filter
         status_filter: Optional status filter
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Simplified CSV file
     """
-    repo = PatternRepository(db)
-    patterns = repo.list(
-        category=category,
-        status=status_filter,
-        limit=10000,
-        offset=0
-    )
+    patterns = repo.iter(category=category, status=status_filter)
     
     # Generate simplified CSV
     csv_content = patterns_to_csv_simple(patterns)
@@ -957,10 +1378,10 @@ async def export_patterns_csv_simple(
 
 
 @app.post("/import/jsonl", tags=["Import"])
-async def import_patterns_jsonl(
+def import_patterns_jsonl(
     file: UploadFile = File(..., description="JSONL file containing patterns"),
     skip_existing: bool = Query(True, description="Skip patterns that already exist"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Import patterns from a JSONL (JSON Lines) file.
@@ -972,7 +1393,7 @@ async def import_patterns_jsonl(
         file: JSONL file upload
         skip_existing: If True, skip patterns with IDs that already exist.
                       If False, return error on duplicate IDs.
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Dictionary with import statistics:
@@ -991,7 +1412,6 @@ async def import_patterns_jsonl(
             detail="File must have .jsonl extension"
         )
     
-    repo = PatternRepository(db)
     
     # Statistics tracking
     stats = {
@@ -1004,27 +1424,37 @@ async def import_patterns_jsonl(
     
     try:
         # Read file content
-        content = await file.read()
+        content = file.file.read()
         text_content = content.decode('utf-8')
         
-        # Process line by line
+        # Decode every line first so existing IDs can be looked up in one batch
+        records = []
         for line_num, line in enumerate(text_content.strip().split('\n'), start=1):
             if not line.strip():
                 continue  # Skip empty lines
             
             stats["total"] += 1
-            
             try:
-                # Parse JSON line
-                pattern_data = json.loads(line)
+                records.append((line_num, orjson.loads(line)))
+            except orjson.JSONDecodeError as e:
+                records.append((line_num, e))
+        
+        existing_ids = repo.existing_ids(
+            data["id"] for _, data in records
+            if isinstance(data, dict) and isinstance(data.get("id"), str)
+        )
+        
+        # Process line by line
+        for line_num, pattern_data in records:
+            try:
+                if isinstance(pattern_data, orjson.JSONDecodeError):
+                    raise pattern_data
                 
                 # Validate and create Pattern instance
                 pattern = Pattern(**pattern_data)
                 
                 # Check if pattern already exists
-                existing = repo.get_by_id(pattern.id)
-                
-                if existing:
+                if pattern.id in existing_ids:
                     if skip_existing:
                         stats["skipped"] += 1
                         continue
@@ -1039,9 +1469,11 @@ async def import_patterns_jsonl(
                 
                 # Create pattern in database
                 repo.create(pattern)
+                existing_ids.add(pattern.id)
+                invalidate_pattern_caches()
                 stats["imported"] += 1
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 stats["failed"] += 1
                 stats["errors"].append({
                     "line": line_num,
@@ -1082,10 +1514,10 @@ async def import_patterns_jsonl(
 
 
 @app.post("/import/json", tags=["Import"])
-async def import_patterns_json(
+def import_patterns_json(
     file: UploadFile = File(..., description="JSON file containing array of patterns"),
     skip_existing: bool = Query(True, description="Skip patterns that already exist"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Import patterns from a JSON file containing an array of patterns.
@@ -1096,7 +1528,7 @@ async def import_patterns_json(
         file: JSON file upload
         skip_existing: If True, skip patterns with IDs that already exist.
                       If False, return error on duplicate IDs.
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Dictionary with import statistics
@@ -1113,7 +1545,6 @@ async def import_patterns_json(
             detail="File must have .json extension"
         )
     
-    repo = PatternRepository(db)
     
     # Statistics tracking
     stats = {
@@ -1126,7 +1557,7 @@ async def import_patterns_json(
     
     try:
         # Read and parse JSON file
-        content = await file.read()
+        content = file.file.read()
         patterns_data = json.loads(content)
         
         if not isinstance(patterns_data, list):
@@ -1136,6 +1567,10 @@ async def import_patterns_json(
             )
         
         stats["total"] = len(patterns_data)
+        existing_ids = repo.existing_ids(
+            data["id"] for data in patterns_data
+            if isinstance(data, dict) and isinstance(data.get("id"), str)
+        )
         
         # Process each pattern
         for index, pattern_data in enumerate(patterns_data):
@@ -1144,9 +1579,7 @@ async def import_patterns_json(
                 pattern = Pattern(**pattern_data)
                 
                 # Check if pattern already exists
-                existing = repo.get_by_id(pattern.id)
-                
-                if existing:
+                if pattern.id in existing_ids:
                     if skip_existing:
                         stats["skipped"] += 1
                         continue
@@ -1161,6 +1594,8 @@ async def import_patterns_json(
                 
                 # Create pattern in database
                 repo.create(pattern)
+                existing_ids.add(pattern.id)
+                invalidate_pattern_caches()
                 stats["imported"] += 1
                 
             except ValueError as e:
@@ -1203,10 +1638,10 @@ async def import_patterns_json(
 
 
 @app.post("/import/compact", tags=["Import"])
-async def import_patterns_compact(
+def import_patterns_compact(
     file: UploadFile = File(..., description="Compact JSONL file containing patterns"),
     skip_existing: bool = Query(True, description="Skip patterns that already exist"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Import patterns from compact JSONL format.
@@ -1235,7 +1670,7 @@ async def import_patterns_compact(
     Args:
         file: Compact JSONL file upload
         skip_existing: If True, skip patterns with IDs that already exist
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Dictionary with import statistics and token savings information
@@ -1246,7 +1681,6 @@ async def import_patterns_compact(
             detail="File must have .jsonl extension"
         )
     
-    repo = PatternRepository(db)
     
     # Statistics tracking
     stats = {
@@ -1259,20 +1693,19 @@ async def import_patterns_compact(
     
     try:
         # Read file content
-        content = await file.read()
+        content = file.file.read()
         compact_jsonl = content.decode('utf-8')
         
         # Parse compact format
         patterns = import_compact_jsonl(compact_jsonl)
         stats["total"] = len(patterns)
+        existing_ids = repo.existing_ids(pattern.id for pattern in patterns)
         
         # Import each pattern
         for pattern in patterns:
             try:
                 # Check if pattern already exists
-                existing = repo.get_by_id(pattern.id)
-                
-                if existing:
+                if pattern.id in existing_ids:
                     if skip_existing:
                         stats["skipped"] += 1
                         continue
@@ -1286,6 +1719,8 @@ async def import_patterns_compact(
                 
                 # Create pattern in database
                 repo.create(pattern)
+                existing_ids.add(pattern.id)
+                invalidate_pattern_caches()
                 stats["imported"] += 1
                 
             except ValueError as e:
@@ -1328,10 +1763,10 @@ async def import_patterns_compact(
 
 
 @app.post("/import/csv-compact", tags=["Import"])
-async def import_patterns_csv_compact(
+def import_patterns_csv_compact(
     file: UploadFile = File(..., description="CSV compact file containing patterns"),
     skip_existing: bool = Query(True, description="Skip patterns that already exist"),
-    db: Session = Depends(get_db)
+    repo: PatternRepository = Depends(get_repo)
 ):
     """
     Import patterns from CSV compact format.
@@ -1352,7 +1787,7 @@ async def import_patterns_csv_compact(
     Args:
         file: CSV file upload
         skip_existing: If True, skip patterns with IDs that already exist
-        db: Database session
+        repo: Pattern repository
         
     Returns:
         Dictionary with import statistics
@@ -1363,7 +1798,6 @@ async def import_patterns_csv_compact(
             detail="File must have .csv extension"
         )
     
-    repo = PatternRepository(db)
     
     # Statistics tracking
     stats = {
@@ -1376,20 +1810,19 @@ async def import_patterns_csv_compact(
     
     try:
         # Read file content
-        content = await file.read()
+        content = file.file.read()
         csv_content = content.decode('utf-8')
         
         # Parse CSV compact format
         patterns = csv_to_patterns(csv_content)
         stats["total"] = len(patterns)
+        existing_ids = repo.existing_ids(pattern.id for pattern in patterns)
         
         # Import each pattern
         for pattern in patterns:
             try:
                 # Check if pattern already exists
-                existing = repo.get_by_id(pattern.id)
-                
-                if existing:
+                if pattern.id in existing_ids:
                     if skip_existing:
                         stats["skipped"] += 1
                         continue
@@ -1403,6 +1836,8 @@ async def import_patterns_csv_compact(
                 
                 # Create pattern in database
                 repo.create(pattern)
+                existing_ids.add(pattern.id)
+                invalidate_pattern_caches()
                 stats["imported"] += 1
                 
             except ValueError as e:
@@ -1445,12 +1880,14 @@ async def import_patterns_csv_compact(
 
 
 @app.get("/statistics", tags=["Statistics"])
-async def get_statistics(db: Session = Depends(get_db)):
+def get_statistics(repo: PatternRepository = Depends(get_repo)):
     """Get statistics about the pattern collection."""
-    repo = PatternRepository(db)
-    return repo.get_statistics()
+    return response_cache.get_or_compute(("statistics",), TTL_LONG, repo.get_statistics)
 
 
 if __name__ == "__main__":
     import uvicorn
+    # uvicorn's "auto" loop and HTTP settings pick uvloop and httptools when
+    # installed (uvicorn[standard]). Stay on one worker: the response and XML
+    # caches are per process and are invalidated in process.
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,100 @@
+"""
+In-process response cache for read-mostly API endpoints.
+
+Entries expire after a per-endpoint TTL. When recomputing an expired entry
+fails with a database error, the last good value is served instead so that
+read endpoints keep answering through short database outages.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+
+# TTL policies in seconds
+TTL_SHORT = 5
+TTL_NORMAL = 30
+TTL_LONG = 60
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its generation and expiry timestamps."""
+    value: Any
+    generated_at: float
+    stale_at: float
+
+
+class ResponseCache:
+    """Bounded TTL cache keyed by (namespace, *params), evicted least-recently-used."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], CacheEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(
+        self,
+        key: Tuple[Hashable, ...],
+        ttl: float,
+        compute: Callable[[], Any],
+        stale_on_error: bool = True
+    ) -> Any:
+        """
+        Return the cached value for key, recomputing it once expired.
+
+        Args:
+            key: Cache key; the first element is the namespace
+            ttl: Lifetime of a freshly computed value in seconds
+            compute: Callable producing the value
+            stale_on_error: Serve the expired value if compute() raises a
+                database error
+
+        Returns:
+            The cached or freshly computed value
+
+        Raises:
+            SQLAlchemyError: If compute() fails and no fallback is available
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and now < entry.stale_at:
+            return entry.value
+
+        try:
+            value = compute()
+        except SQLAlchemyError:
+            if stale_on_error and entry is not None:
+                return entry.value
+            raise
+
+        with self._lock:
+            self._entries[key] = CacheEntry(value=value, generated_at=now, stale_at=now + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            namespace: Only drop keys in this namespace; all entries if None
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+
+response_cache = ResponseCache()
@@ -13,21 +13,34 @@ Version: 2.0
 """
 
 import re
-import json
 import csv
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Tuple, Set
 from pathlib import Path
 import sys
 
+import orjson
+
+
+# Dependencies field names, in export order
+DEPENDENCY_TYPES = ('requires', 'uses', 'specializes', 'specialized_by')
+
+# Pattern type names by ID prefix letter
+PATTERN_TYPE_NAMES = {'C': 'concept', 'F': 'flow', 'P': 'pattern'}
+
+# Type letters stripped from pattern IDs when sorting numerically
+PATTERN_TYPE_LETTERS_RE = re.compile(r'[PCF]')
+
 
 # ============================================================================
 # Domain Model - Shared with corpus_converter.py
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """Tuple component definition"""
     name: str
@@ -36,7 +49,7 @@ class Component:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeDefinition:
     """Type definition"""
     name: str
@@ -45,7 +58,7 @@ class TypeDefinition:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Formal property specification"""
     id: str
@@ -55,7 +68,7 @@ class Property:
     invariants: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     """Operation definition"""
     name: str
@@ -66,7 +79,7 @@ class Operation:
     effects: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependencies:
     """Pattern dependencies"""
     requires: List[str] = field(default_factory=list)
@@ -75,14 +88,14 @@ class Dependencies:
     specialized_by: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Manifestation:
     """Real-world manifestation"""
     name: str
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """Complete pattern specification - master data model"""
     id: str
@@ -120,6 +133,12 @@ class Pattern:
 # XML Parser - Master Data Input
 # ============================================================================
 
+# Namespace-qualified tag -> local name, filled as tags are first seen. The
+# schema has a few dozen element names, so every pattern after the first
+# resolves its tags with a dict lookup instead of splitting each one.
+_LOCAL_TAGS: Dict[str, str] = {}
+
+
 class XMLParser:
     """Parse XML pattern files into Pattern domain model"""
     
@@ -127,15 +146,30 @@ class XMLParser:
     def parse_pattern_file(xml_path: Path) -> Pattern:
         """Parse a single XML pattern file"""
         tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
+        return XMLParser._parse_root(tree.getroot())
+    
+    @staticmethod
+    def parse_pattern_string(xml_content: str) -> Pattern:
+        """Parse a pattern from an XML document held in memory"""
+        root = ET.fromstring(xml_content)
+        return XMLParser._parse_root(root)
+    
+    @staticmethod
+    def _parse_root(root) -> Pattern:
+        """Build a Pattern from a parsed <pattern> root element"""
         # Remove namespace for easier parsing
+        local_tags = _LOCAL_TAGS
         for elem in root.iter():
-            if '}' in elem.tag:
-                elem.tag = elem.tag.split('}', 1)[1]
-        
+            tag = elem.tag
+            local = local_tags.get(tag)
+            if local is None:
+                local = local_tags[tag] = tag.rpartition('}')[2]
+            elem.tag = local
+        
+        # Pattern IDs are interned so the same ID read as a pattern key and as
+        # every pattern-ref shares one string object
         pattern = Pattern(
-            id=root.get('id', ''),
+            id=sys.intern(root.get('id', '')),
             version=root.get('version', '1.0'),
             name='',
             category='pattern'
@@ -224,10 +258,10 @@ class XMLParser:
         deps = root.find('dependencies')
         if deps is not None:
             pattern.dependencies = Dependencies(
-                requires=[p.text for p in deps.findall('requires/pattern-ref') if p.text],
-                uses=[p.text for p in deps.findall('uses/pattern-ref') if p.text],
-                specializes=[p.text for p in deps.findall('specializes/pattern-ref') if p.text],
-                specialized_by=[p.text for p in deps.findall('specialized-by/pattern-ref') if p.text]
+                requires=[sys.intern(p.text) for p in deps.findall('requires/pattern-ref') if p.text],
+                uses=[sys.intern(p.text) for p in deps.findall('uses/pattern-ref') if p.text],
+                specializes=[sys.intern(p.text) for p in deps.findall('specializes/pattern-ref') if p.text],
+                specialized_by=[sys.intern(p.text) for p in deps.findall('specialized-by/pattern-ref') if p.text]
             )
         
         # Parse manifestations
@@ -245,7 +279,25 @@ class XMLParser:
     def _get_text(element: ET.Element, child_name: str, default: str = '') -> str:
         """Safely get text from child element"""
         child = element.find(child_name)
-        return child.text if child is not None and child.text else default
+        if child is None:
+            return default
+        return child.text or default
+
+
+def _parse_xml_file(xml_path: Path) -> Tuple[Optional[Pattern], Optional[str]]:
+    """Parse one pattern file, returning the error message instead of raising (called in-process or in a worker)"""
+    try:
+        return XMLParser.parse_pattern_file(xml_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _intern_pattern_ids(pattern: Pattern) -> None:
+    """Re-intern a pattern's ID and pattern-refs after unpickling, which yields fresh string copies"""
+    pattern.id = sys.intern(pattern.id)
+    deps = pattern.dependencies
+    for dep_type in DEPENDENCY_TYPES:
+        setattr(deps, dep_type, [sys.intern(ref) for ref in getattr(deps, dep_type)])
 
 
 # ============================================================================
@@ -265,24 +317,36 @@ class CorpusManager:
     def __init__(self):
         self.patterns: Dict[str, Pattern] = {}
         self.metadata: Dict[str, str] = {}
+        # Export order, paired with the pattern IDs it was computed from
+        self._sorted_ids: Optional[Tuple[Tuple[str, ...], List[str]]] = None
     
-    def load_from_xml_directory(self, xml_dir: Path) -> None:
+    def load_from_xml_directory(self, xml_dir: Path, workers: int = 1) -> None:
         """
         Load all XML pattern files from a directory.
         This is the primary method for loading master data.
+        
+        Files are independent, so with workers > 1 they are parsed in that
+        many worker processes; patterns are still added in file order.
         """
         if not xml_dir.exists():
             raise FileNotFoundError(f"XML directory not found: {xml_dir}")
         
         xml_files = sorted(xml_dir.glob('*.xml'))
         
-        for xml_file in xml_files:
-            try:
-                pattern = XMLParser.parse_pattern_file(xml_file)
-                self.patterns[pattern.id] = pattern
-            except Exception as e:
-                print(f"Warning: Failed to parse {xml_file.name}: {e}", file=sys.stderr)
+        parallel = workers > 1 and len(xml_files) > 1
+        if parallel:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_xml_file, xml_files, chunksize=16))
+        else:
+            results = map(_parse_xml_file, xml_files)
+        
+        for xml_file, (pattern, error) in zip(xml_files, results):
+            if error is not None:
+                print(f"Warning: Failed to parse {xml_file.name}: {error}", file=sys.stderr)
                 continue
+            if parallel:
+                _intern_pattern_ids(pattern)
+            self.patterns[pattern.id] = pattern
     
     def load_pattern_xml(self, xml_path: Path) -> Pattern:
         """Load a single pattern from XML file"""
@@ -320,6 +384,15 @@ class CorpusManager:
     
     def _pattern_to_xml(self, pattern: Pattern) -> str:
         """Convert Pattern to XML string"""
+        root = self._pattern_to_element(pattern)
+        
+        # Pretty print
+        xml_str = ET.tostring(root, encoding='unicode')
+        dom = minidom.parseString(xml_str)
+        return dom.toprettyxml(indent='  ')
+    
+    def _pattern_to_element(self, pattern: Pattern) -> ET.Element:
+        """Convert Pattern to a <pattern> element tree"""
         root = ET.Element('pattern')
         root.set('xmlns', 'http://universal-corpus.org/schema/v1')
         root.set('id', pattern.id)
@@ -434,10 +507,7 @@ class CorpusManager:
                 if manif.description:
                     ET.SubElement(manifestation, 'description').text = manif.description
         
-        # Pretty print
-        xml_str = ET.tostring(root, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent='  ')
+        return root
     
     def export_to_markdown(self, pattern_id: str, output_path: Optional[Path] = None) -> str:
         """Export a pattern to Markdown format (human-readable view)"""
@@ -524,17 +594,17 @@ class CorpusManager:
                     lines.append(f"   {op.formal_definition}")
         
         # Dependencies
-        if any([pattern.dependencies.requires, pattern.dependencies.uses,
-                pattern.dependencies.specializes, pattern.dependencies.specialized_by]):
+        deps = pattern.dependencies
+        if deps.requires or deps.uses or deps.specializes or deps.specialized_by:
             lines.append("\n**Dependencies:**")
-            if pattern.dependencies.requires:
-                lines.append(f"- **Requires:** {', '.join(pattern.dependencies.requires)}")
-            if pattern.dependencies.uses:
-                lines.append(f"- **Uses:** {', '.join(pattern.dependencies.uses)}")
-            if pattern.dependencies.specializes:
-                lines.append(f"- **Specializes:** {', '.join(pattern.dependencies.specializes)}")
-            if pattern.dependencies.specialized_by:
-                lines.append(f"- **Specialized By:** {', '.join(pattern.dependencies.specialized_by)}")
+            if deps.requires:
+                lines.append(f"- **Requires:** {', '.join(deps.requires)}")
+            if deps.uses:
+                lines.append(f"- **Uses:** {', '.join(deps.uses)}")
+            if deps.specializes:
+                lines.append(f"- **Specializes:** {', '.join(deps.specializes)}")
+            if deps.specialized_by:
+                lines.append(f"- **Specialized By:** {', '.join(deps.specialized_by)}")
         
         # Manifestations
         if pattern.manifestations:
@@ -565,35 +635,26 @@ class CorpusManager:
         # Export to XML
         xml_content = self._pattern_to_xml(original)
         
-        # Parse it back
-        from tempfile import NamedTemporaryFile
-        with NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as tmp:
-            tmp.write(xml_content)
-            tmp_path = Path(tmp.name)
+        # Parse it back in memory
+        reconstructed = XMLParser.parse_pattern_string(xml_content)
         
-        try:
-            reconstructed = XMLParser.parse_pattern_file(tmp_path)
-            
-            # Compare key fields
-            if original.id != reconstructed.id:
-                return False, f"ID mismatch: {original.id} vs {reconstructed.id}"
-            
-            if original.name != reconstructed.name:
-                return False, f"Name mismatch: {original.name} vs {reconstructed.name}"
-            
-            if len(original.components) != len(reconstructed.components):
-                return False, f"Component count mismatch: {len(original.components)} vs {len(reconstructed.components)}"
-            
-            if len(original.properties) != len(reconstructed.properties):
-                return False, f"Property count mismatch: {len(original.properties)} vs {len(reconstructed.properties)}"
-            
-            if len(original.operations) != len(reconstructed.operations):
-                return False, f"Operation count mismatch: {len(original.operations)} vs {len(reconstructed.operations)}"
-            
-            return True, "Perfect XML round-trip: pattern identical"
-            
-        finally:
-            tmp_path.unlink()
+        # Compare key fields
+        if original.id != reconstructed.id:
+            return False, f"ID mismatch: {original.id} vs {reconstructed.id}"
+        
+        if original.name != reconstructed.name:
+            return False, f"Name mismatch: {original.name} vs {reconstructed.name}"
+        
+        if len(original.components) != len(reconstructed.components):
+            return False, f"Component count mismatch: {len(original.components)} vs {len(reconstructed.components)}"
+        
+        if len(original.properties) != len(reconstructed.properties):
+            return False, f"Property count mismatch: {len(original.properties)} vs {len(reconstructed.properties)}"
+        
+        if len(original.operations) != len(reconstructed.operations):
+            return False, f"Operation count mismatch: {len(original.operations)} vs {len(reconstructed.operations)}"
+        
+        return True, "Perfect XML round-trip: pattern identical"
     
     def validate_all_roundtrips(self) -> Dict[str, Tuple[bool, str]]:
         """Validate XML round-trip for all patterns"""
@@ -628,20 +689,32 @@ class CorpusManager:
     
     def list_patterns(self, pattern_type: Optional[str] = None) -> List[str]:
         """List all pattern IDs, optionally filtered by type."""
-        # Filter out empty pattern IDs
-        valid_ids = [pid for pid in self.patterns.keys() if pid]
-        
-        pattern_ids = sorted(valid_ids, 
-                            key=lambda x: (x[0] if x else '', self._extract_sort_number(x)))
-        
+        # Filter out empty pattern IDs, and other types; the export order is
+        # already numeric, so a stable sort on the type letter groups it by type
         if pattern_type:
-            pattern_ids = [pid for pid in pattern_ids if pid.startswith(pattern_type)]
+            valid_ids = [pid for pid in self._sorted_pattern_ids() if pid and pid.startswith(pattern_type)]
+        else:
+            valid_ids = [pid for pid in self._sorted_pattern_ids() if pid]
         
-        return pattern_ids
+        return sorted(valid_ids, key=lambda x: x[0])
+    
+    def _sorted_pattern_ids(self) -> List[str]:
+        """
+        Pattern IDs in numeric order, as every export writes them.
+        
+        The order depends only on the IDs and their insertion order, so it is
+        reused for as long as the keys of patterns are unchanged, however the
+        dict is modified, and shared by the exports (export-all runs several
+        in a row). The returned list must not be modified.
+        """
+        pattern_ids = tuple(self.patterns)
+        if self._sorted_ids is None or self._sorted_ids[0] != pattern_ids:
+            self._sorted_ids = (pattern_ids, sorted(pattern_ids, key=self._extract_sort_number))
+        return self._sorted_ids[1]
     
     def _extract_sort_number(self, pattern_id: str) -> float:
         """Extract numeric part for sorting (handles decimals like F1.1)"""
-        num_str = re.sub(r'[PCF]', '', pattern_id)
+        num_str = PATTERN_TYPE_LETTERS_RE.sub('', pattern_id)
         try:
             return float(num_str)
         except ValueError:
@@ -652,63 +725,154 @@ class CorpusManager:
         missing = {'P': [], 'C': [], 'F': []}
         
         # Check P patterns (expect P1-P155)
-        p_numbers = [int(p[1:]) for p in self.patterns.keys() 
-                     if p.startswith('P') and '.' not in p]
+        p_numbers = {int(p[1:]) for p in self.patterns.keys() 
+                     if p.startswith('P') and '.' not in p}
         if p_numbers:
-            for i in range(1, max(p_numbers) + 1):
-                if i not in p_numbers:
-                    missing['P'].append(f'P{i}')
+            missing['P'] = [f'P{i}' for i in sorted(set(range(1, max(p_numbers) + 1)) - p_numbers)]
         
         # Check C patterns (expect C1-C5)
-        c_numbers = [int(p[1:]) for p in self.patterns.keys() 
-                     if p.startswith('C') and '.' not in p]
+        c_numbers = {int(p[1:]) for p in self.patterns.keys() 
+                     if p.startswith('C') and '.' not in p}
         if c_numbers:
-            for i in range(1, max(c_numbers) + 1):
-                if i not in c_numbers:
-                    missing['C'].append(f'C{i}')
+            missing['C'] = [f'C{i}' for i in sorted(set(range(1, max(c_numbers) + 1)) - c_numbers)]
         
         # F patterns can have decimals (F1.1, F2.3), just list what we have
         # Don't check for missing as the numbering scheme is flexible
         
         return {k: v for k, v in missing.items() if v}
     
-    def get_dependency_graph(self) -> Dict[str, Set[str]]:
-        """Build dependency graph (pattern_id -> set of dependencies)"""
+    def get_dependency_graph(self) -> Dict[str, List[str]]:
+        """
+        Build dependency graph (pattern_id -> list of dependencies).
+        
+        Each list is deduplicated and keeps declaration order (requires, uses,
+        specializes), so graph walks and the cycles they report are the same
+        on every run. The graph is rebuilt on every call, a single pass over
+        the patterns, so it always reflects the current patterns and their
+        dependency lists, however they were changed.
+        """
         graph = {}
         for pattern_id, pattern in self.patterns.items():
-            deps = set()
-            deps.update(pattern.dependencies.requires)
-            deps.update(pattern.dependencies.uses)
-            deps.update(pattern.dependencies.specializes)
-            graph[pattern_id] = deps
+            deps = pattern.dependencies
+            graph[pattern_id] = list(dict.fromkeys(deps.requires + deps.uses + deps.specializes))
         return graph
     
     def find_circular_dependencies(self) -> List[List[str]]:
-        """Find circular dependency chains"""
+        """
+        Find circular dependency chains.
+        
+        Every strongly connected component with more than one pattern (or a
+        pattern depending on itself) is covered by shortest chains: starting
+        from its lowest-numbered pattern, each chain runs from the
+        lowest-numbered member not yet on a reported chain back to itself,
+        until every member of the component appears on some chain. A simple
+        cycle is therefore reported as a single chain.
+        """
         graph = self.get_dependency_graph()
         cycles = []
+        for component in self._strongly_connected_components(graph):
+            members = set(component)
+            covered: Set[str] = set()
+            for start in sorted(component, key=self._extract_sort_number):
+                if start in covered:
+                    continue
+                cycle = self._shortest_cycle(graph, start, members)
+                covered.update(cycle)
+                cycles.append(cycle)
+        cycles.sort(key=lambda cycle: self._extract_sort_number(cycle[0]))
+        return cycles
+    
+    def _circular_component_ids(
+        self, graph: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, int]:
+        """
+        Map each pattern on a dependency cycle to the id of its cyclic component.
         
-        def dfs(node: str, path: List[str], visited: Set[str]) -> None:
-            if node in path:
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                if cycle not in cycles:
-                    cycles.append(cycle)
-                return
-            
-            if node in visited or node not in graph:
-                return
-            
-            visited.add(node)
-            path.append(node)
+        An edge is circular exactly when both ends share a component id, which
+        covers every edge of every cycle, not just those on the chains
+        find_circular_dependencies reports. Pass graph when the caller already
+        built it.
+        """
+        if graph is None:
+            graph = self.get_dependency_graph()
+        return {
+            pattern_id: component_id
+            for component_id, component in enumerate(self._strongly_connected_components(graph))
+            for pattern_id in component
+        }
+    
+    @staticmethod
+    def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Find the cyclic strongly connected components of a dependency graph.
+        
+        Iterative Tarjan: one O(V+E) pass with an explicit work stack, so deep
+        dependency chains cannot hit the recursion limit. References to
+        patterns missing from the graph are ignored.
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+        
+        for root in graph:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
             
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in graph:
+                        continue
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(graph[neighbor])))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    # All neighbors visited: backtrack
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in graph[node]:
+                            components.append(component)
+        
+        return components
+    
+    @staticmethod
+    def _shortest_cycle(graph: Dict[str, List[str]], start: str, component: Set[str]) -> List[str]:
+        """Breadth-first search for the shortest chain from start back to start within a component"""
+        parents: Dict[str, str] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
             for neighbor in graph[node]:
-                dfs(neighbor, path[:], visited)
-        
-        for pattern_id in graph:
-            dfs(pattern_id, [], set())
-        
-        return cycles
+                if neighbor == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    return path[::-1] + [start]
+                if neighbor in component and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        return [start, start]
     
     def create_corpus_manifest(self, output_path: Path) -> None:
         """
@@ -722,7 +886,7 @@ class CorpusManager:
             'patterns': []
         }
         
-        for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+        for pattern_id in self._sorted_pattern_ids():
             pattern = self.patterns[pattern_id]
             manifest['patterns'].append({
                 'id': pattern.id,
@@ -741,12 +905,22 @@ class CorpusManager:
                 }
             })
         
-        output_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        output_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
     
     def export_unified_corpus_xml(self, output_path: Path) -> None:
         """
         Export all patterns into a single unified XML corpus file.
         This creates a complete corpus document from individual patterns.
+        
+        Pattern elements are attached as built and the whole document is
+        indented once, rather than serializing and re-parsing each pattern.
+        
+        Output format: every element is unprefixed in the default
+        http://universal-corpus.org/schema/v1 namespace (each <pattern> also
+        repeats the xmlns declaration, as in the single-pattern files), with
+        two-space indentation and no whitespace-only lines. Files written
+        before this layout used ns0:-prefixed pattern elements and blank
+        lines; namespace-aware parsers read both as the same elements.
         """
         root = ET.Element('corpus')
         root.set('xmlns', 'http://universal-corpus.org/schema/v1')
@@ -759,18 +933,13 @@ class CorpusManager:
         
         # Patterns (sorted)
         patterns_elem = ET.SubElement(root, 'patterns')
-        for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
-            pattern = self.patterns[pattern_id]
-            
-            # Parse the pattern XML and attach it
-            pattern_xml = self._pattern_to_xml(pattern)
-            pattern_tree = ET.fromstring(pattern_xml)
-            patterns_elem.append(pattern_tree)
+        for pattern_id in self._sorted_pattern_ids():
+            patterns_elem.append(self._pattern_to_element(self.patterns[pattern_id]))
         
         # Pretty print
+        ET.indent(root, space='  ')
         xml_str = ET.tostring(root, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        output_path.write_text(dom.toprettyxml(indent='  '), encoding='utf-8')
+        output_path.write_text(f'<?xml version="1.0" ?>\n{xml_str}\n', encoding='utf-8')
     
     def export_to_csv_summary(self, output_path: Path) -> None:
         """
@@ -792,30 +961,19 @@ class CorpusManager:
             writer.writeheader()
             
             # Get circular dependencies for marking
-            cycles = self.find_circular_dependencies()
-            patterns_in_cycles = set()
-            for cycle in cycles:
-                patterns_in_cycles.update(cycle)
+            patterns_in_cycles = self._circular_component_ids()
             
             # Write pattern rows
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type from ID prefix
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 # Count total dependencies
-                dep_count = (len(pattern.dependencies.requires) + 
-                           len(pattern.dependencies.uses) +
-                           len(pattern.dependencies.specializes) +
-                           len(pattern.dependencies.specialized_by))
+                dep_count = sum(
+                    len(getattr(pattern.dependencies, dep_type)) for dep_type in DEPENDENCY_TYPES
+                )
                 
                 writer.writerow({
                     'id': pattern.id,
@@ -851,18 +1009,11 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 for component in pattern.components:
                     writer.writerow({
@@ -892,18 +1043,11 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 for operation in pattern.operations:
                     # Clean formal definition for CSV
@@ -937,18 +1081,11 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 for prop in pattern.properties:
                     writer.writerow({
@@ -978,99 +1115,43 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            # Get circular dependencies
-            cycles = self.find_circular_dependencies()
-            circular_pairs = set()
-            for cycle in cycles:
-                for i in range(len(cycle) - 1):
-                    circular_pairs.add((cycle[i], cycle[i + 1]))
+            # Get circular dependencies: a graph edge is circular when both
+            # ends are in the same cyclic component
+            graph = self.get_dependency_graph()
+            component_of = self._circular_component_ids(graph)
             
-            def get_pattern_type(pid: str) -> str:
-                if pid and pid[0] == 'C':
-                    return 'concept'
-                elif pid and pid[0] == 'F':
-                    return 'flow'
-                elif pid and pid[0] == 'P':
-                    return 'pattern'
-                return 'unknown'
+            def is_circular(source: str, target: str) -> bool:
+                component = component_of.get(source)
+                return (
+                    component is not None
+                    and component_of.get(target) == component
+                    and target in graph[source]
+                )
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
-                source_type = get_pattern_type(pattern.id)
+                source_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 # Export each dependency relationship
-                for target in pattern.dependencies.requires:
-                    # Validate target exists
-                    target_pattern = self.patterns.get(target)
-                    is_valid = target_pattern is not None
-                    target_name = target_pattern.name if target_pattern else ''
-                    target_type = get_pattern_type(target) if is_valid else 'unknown'
-                    
-                    writer.writerow({
-                        'source_id': pattern.id,
-                        'source_name': pattern.name,
-                        'source_type': source_type,
-                        'target_id': target,
-                        'target_name': target_name,
-                        'target_type': target_type,
-                        'relationship_type': 'requires',
-                        'is_circular': 'yes' if (pattern.id, target) in circular_pairs else 'no',
-                        'is_valid': 'yes' if is_valid else 'no'
-                    })
-                
-                for target in pattern.dependencies.uses:
-                    target_pattern = self.patterns.get(target)
-                    is_valid = target_pattern is not None
-                    target_name = target_pattern.name if target_pattern else ''
-                    target_type = get_pattern_type(target) if is_valid else 'unknown'
-                    
-                    writer.writerow({
-                        'source_id': pattern.id,
-                        'source_name': pattern.name,
-                        'source_type': source_type,
-                        'target_id': target,
-                        'target_name': target_name,
-                        'target_type': target_type,
-                        'relationship_type': 'uses',
-                        'is_circular': 'yes' if (pattern.id, target) in circular_pairs else 'no',
-                        'is_valid': 'yes' if is_valid else 'no'
-                    })
-                
-                for target in pattern.dependencies.specializes:
-                    target_pattern = self.patterns.get(target)
-                    is_valid = target_pattern is not None
-                    target_name = target_pattern.name if target_pattern else ''
-                    target_type = get_pattern_type(target) if is_valid else 'unknown'
-                    
-                    writer.writerow({
-                        'source_id': pattern.id,
-                        'source_name': pattern.name,
-                        'source_type': source_type,
-                        'target_id': target,
-                        'target_name': target_name,
-                        'target_type': target_type,
-                        'relationship_type': 'specializes',
-                        'is_circular': 'yes' if (pattern.id, target) in circular_pairs else 'no',
-                        'is_valid': 'yes' if is_valid else 'no'
-                    })
-                
-                for target in pattern.dependencies.specialized_by:
-                    target_pattern = self.patterns.get(target)
-                    is_valid = target_pattern is not None
-                    target_name = target_pattern.name if target_pattern else ''
-                    target_type = get_pattern_type(target) if is_valid else 'unknown'
-                    
-                    writer.writerow({
-                        'source_id': pattern.id,
-                        'source_name': pattern.name,
-                        'source_type': source_type,
-                        'target_id': target,
-                        'target_name': target_name,
-                        'target_type': target_type,
-                        'relationship_type': 'specialized_by',
-                        'is_circular': 'yes' if (pattern.id, target) in circular_pairs else 'no',
-                        'is_valid': 'yes' if is_valid else 'no'
-                    })
+                for relationship_type in DEPENDENCY_TYPES:
+                    for target in getattr(pattern.dependencies, relationship_type):
+                        # Validate target exists
+                        target_pattern = self.patterns.get(target)
+                        is_valid = target_pattern is not None
+                        target_name = target_pattern.name if target_pattern else ''
+                        target_type = PATTERN_TYPE_NAMES.get(target[:1], 'unknown') if is_valid else 'unknown'
+                        
+                        writer.writerow({
+                            'source_id': pattern.id,
+                            'source_name': pattern.name,
+                            'source_type': source_type,
+                            'target_id': target,
+                            'target_name': target_name,
+                            'target_type': target_type,
+                            'relationship_type': relationship_type,
+                            'is_circular': 'yes' if is_circular(pattern.id, target) else 'no',
+                            'is_valid': 'yes' if is_valid else 'no'
+                        })
     
     def export_to_csv_type_definitions(self, output_path: Path) -> None:
         """
@@ -1086,18 +1167,11 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 for type_def in pattern.type_definitions:
                     writer.writerow({
@@ -1123,18 +1197,11 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 # Detect pattern type
-                if pattern.id and pattern.id[0] == 'C':
-                    pattern_type = 'concept'
-                elif pattern.id and pattern.id[0] == 'F':
-                    pattern_type = 'flow'
-                elif pattern.id and pattern.id[0] == 'P':
-                    pattern_type = 'pattern'
-                else:
-                    pattern_type = 'unknown'
+                pattern_type = PATTERN_TYPE_NAMES.get(pattern.id[:1], 'unknown')
                 
                 for manifestation in pattern.manifestations:
                     writer.writerow({
@@ -1159,7 +1226,7 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 for operation in pattern.operations:
@@ -1207,7 +1274,7 @@ class CorpusManager:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pattern_id in sorted(self.patterns.keys(), key=self._extract_sort_number):
+            for pattern_id in self._sorted_pattern_ids():
                 pattern = self.patterns[pattern_id]
                 
                 for prop in pattern.properties:
@@ -1289,6 +1356,8 @@ def main():
     
     parser.add_argument('input', type=Path, 
                        help='Path to XML file or directory containing XML pattern files')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='Parse XML files in N worker processes (default: 1)')
     parser.add_argument('--stats', action='store_true',
                        help='Show corpus statistics')
     parser.add_argument('--list', choices=['all', 'P', 'C', 'F'],
@@ -1348,7 +1417,7 @@ def main():
     try:
         if input_path.is_dir():
             print(f"Loading XML patterns from: {input_path}", file=sys.stderr)
-            manager.load_from_xml_directory(input_path)
+            manager.load_from_xml_directory(input_path, workers=args.jobs)
         else:
             print(f"Loading XML pattern: {input_path}", file=sys.stderr)
             manager.load_pattern_xml(input_path)
@@ -1362,33 +1431,34 @@ def main():
     # Execute commands
     if args.stats:
         stats = manager.get_stats()
-        print("Corpus Statistics:")
-        for key, value in stats.items():
-            print(f"  {key.replace('_', ' ').title()}: {value}")
+        lines = ["Corpus Statistics:"]
+        lines.extend(f"  {key.replace('_', ' ').title()}: {value}" for key, value in stats.items())
+        print("\n".join(lines))
     
     if args.list:
         pattern_type = None if args.list == 'all' else args.list
         patterns = manager.list_patterns(pattern_type)
-        print(f"Patterns ({len(patterns)}):")
-        for pid in patterns:
-            pattern = manager.get_pattern(pid)
-            print(f"  {pid}: {pattern.name}")
+        # One write for the whole listing rather than a print per pattern
+        lines = [f"Patterns ({len(patterns)}):"]
+        lines.extend(f"  {pid}: {manager.patterns[pid].name}" for pid in patterns)
+        print("\n".join(lines))
     
     if args.missing:
         missing = manager.find_missing_patterns()
         if missing:
-            print("Missing patterns:")
-            for pattern_type, pattern_ids in missing.items():
-                print(f"  {pattern_type}: {', '.join(pattern_ids)}")
+            lines = ["Missing patterns:"]
+            lines.extend(f"  {pattern_type}: {', '.join(pattern_ids)}"
+                         for pattern_type, pattern_ids in missing.items())
+            print("\n".join(lines))
         else:
             print("No missing patterns detected")
     
     if args.cycles:
         cycles = manager.find_circular_dependencies()
         if cycles:
-            print(f"Found {len(cycles)} circular dependency chains:")
-            for cycle in cycles:
-                print(f"  {' → '.join(cycle)}")
+            lines = [f"Found {len(cycles)} circular dependency chains:"]
+            lines.extend(f"  {' → '.join(cycle)}" for cycle in cycles)
+            print("\n".join(lines))
         else:
             print("No circular dependencies detected")
     
@@ -1402,9 +1472,9 @@ def main():
         failed = [(pid, msg) for pid, (valid, msg) in results.items() if not valid]
         
         if failed:
-            print(f"Validation failed for {len(failed)} patterns:")
-            for pid, msg in failed:
-                print(f"  {pid}: {msg}")
+            lines = [f"Validation failed for {len(failed)} patterns:"]
+            lines.extend(f"  {pid}: {msg}" for pid, msg in failed)
+            print("\n".join(lines))
             return 1
         else:
             print(f"✓ All {len(results)} patterns passed XML round-trip validation")
@@ -25,6 +25,7 @@ import argparse
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
+import orjson
 import yaml
 
 from universal_corpus.database import SessionLocal, PatternRepository, init_db
@@ -242,8 +243,7 @@ class PatternCLI:
             data = [p.model_dump() for p in patterns]
             print(json.dumps(data, indent=2, ensure_ascii=False))
         elif format == 'ids':
-            for p in patterns:
-                print(p.id)
+            print("\n".join(p.id for p in patterns))
         elif format == 'table':
             self._print_patterns_table(patterns)
         else:
@@ -491,21 +491,14 @@ class PatternCLI:
         """
         stats = self.repo.get_statistics()
         
-        print("=== Pattern Database Statistics ===\n")
-        print(f"Total patterns: {stats['total_patterns']}")
+        lines = ["=== Pattern Database Statistics ===\n", f"Total patterns: {stats['total_patterns']}"]
         
-        print("\nBy category:")
-        for category, count in sorted(stats['by_category'].items()):
-            print(f"  {category:15} {count:4}")
-        
-        print("\nBy status:")
-        for status, count in sorted(stats['by_status'].items()):
-            print(f"  {status:15} {count:4}")
-        
-        print("\nBy complexity:")
-        for complexity, count in sorted(stats['by_complexity'].items()):
-            print(f"  {complexity:15} {count:4}")
+        for label, key in (('category', 'by_category'), ('status', 'by_status'),
+                           ('complexity', 'by_complexity')):
+            lines.append(f"\nBy {label}:")
+            lines.extend(f"  {value:15} {count:4}" for value, count in sorted(stats[key].items()))
         
+        print("\n".join(lines))
         return 0
     
     # EXPORT operations
@@ -553,22 +546,31 @@ class PatternCLI:
         Returns:
             Exit code
         """
-        patterns = self.repo.list(limit=10000)
+        count = 0
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            # orjson writes UTF-8 bytes directly, so the file is opened in binary mode.
+            # Patterns are read from a cursor and written one at a time, so memory
+            # use does not grow with the size of the collection.
+            with open(output_file, 'wb') as f:
                 if format == 'jsonl':
-                    for pattern in patterns:
-                        json.dump(pattern.model_dump(), f, ensure_ascii=False)
-                        f.write('\n')
+                    for pattern in self.repo.iter():
+                        f.write(orjson.dumps(pattern.model_dump(), option=orjson.OPT_APPEND_NEWLINE))
+                        count += 1
                 elif format == 'json':
-                    data = [p.model_dump() for p in patterns]
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    # Indent each element one level inside the array, matching
+                    # json.dumps(indent=2); string values never hold a raw newline
+                    for pattern in self.repo.iter():
+                        f.write(b"[\n  " if count == 0 else b",\n  ")
+                        element = orjson.dumps(pattern.model_dump(), option=orjson.OPT_INDENT_2)
+                        f.write(element.replace(b"\n", b"\n  "))
+                        count += 1
+                    f.write(b"\n]" if count else b"[]")
                 else:
                     print(f"✗ Unknown format: {format}", file=sys.stderr)
                     return 1
             
-            print(f"✓ Exported {len(patterns)} patterns to: {output_file}")
+            print(f"✓ Exported {count} patterns to: {output_file}")
             return 0
             
         except Exception as e:
@@ -668,30 +670,38 @@ class PatternCLI:
         """Print detailed pattern information."""
         self._print_pattern_summary(pattern)
         
-        print("\n--- Components ---")
+        lines = ["\n--- Components ---"]
         for comp in pattern.definition.components.component:
-            print(f"  {comp.name}: {comp.type}")
-            print(f"    {comp.description}")
+            lines.append(f"  {comp.name}: {comp.type}")
+            lines.append(f"    {comp.description}")
         
-        print("\n--- Properties ---")
+        lines.append("\n--- Properties ---")
         for prop in pattern.properties.property:
-            print(f"  {prop.id}: {prop.name}")
-            print(f"    {prop.formal_spec.content}")
+            lines.append(f"  {prop.id}: {prop.name}")
+            lines.append(f"    {prop.formal_spec.content}")
         
-        print("\n--- Operations ---")
+        lines.append("\n--- Operations ---")
         for op in pattern.operations.operation:
-            print(f"  {op.name}")
-            print(f"    Signature: {op.signature}")
+            lines.append(f"  {op.name}")
+            lines.append(f"    Signature: {op.signature}")
+        
+        # One write for all sections rather than a print per line
+        print("\n".join(lines))
     
     def _print_patterns_table(self, patterns: List[Pattern]):
         """Print patterns in table format."""
-        print(f"{'ID':<10} {'Name':<40} {'Category':<10} {'Status':<10} {'Complexity':<10}")
-        print("-" * 90)
+        lines = [
+            f"{'ID':<10} {'Name':<40} {'Category':<10} {'Status':<10} {'Complexity':<10}",
+            "-" * 90
+        ]
         
         for pattern in patterns:
             name = pattern.metadata.name[:37] + '...' if len(pattern.metadata.name) > 40 else pattern.metadata.name
             complexity = pattern.metadata.complexity or 'N/A'
-            print(f"{pattern.id:<10} {name:<40} {pattern.metadata.category:<10} {pattern.metadata.status:<10} {complexity:<10}")
+            lines.append(f"{pattern.id:<10} {name:<40} {pattern.metadata.category:<10} {pattern.metadata.status:<10} {complexity:<10}")
+        
+        # One write for the whole table rather than a print per row
+        print("\n".join(lines))
 
 
 def main():
@@ -13,9 +13,10 @@ Design Principles:
 Token Savings: ~70-80% reduction compared to full JSONL format
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 from universal_corpus.models import Pattern
 import json
+import orjson
 
 
 def pattern_to_compact(pattern: Pattern) -> Dict[str, Any]:
@@ -409,12 +410,12 @@ def compact_to_pattern(compact: Dict[str, Any]) -> Pattern:
     return Pattern(**pattern_dict)
 
 
-def export_compact_jsonl(patterns: List[Pattern]) -> str:
+def export_compact_jsonl(patterns: Iterable[Pattern]) -> str:
     """
     Export patterns to compact JSONL format.
     
     Args:
-        patterns: List of Pattern objects
+        patterns: Pattern objects (any iterable; consumed once)
         
     Returns:
         JSONL string with one compact pattern per line
@@ -445,7 +446,7 @@ def import_compact_jsonl(jsonl_content: str) -> List[Pattern]:
             continue
         
         try:
-            compact = json.loads(line)
+            compact = orjson.loads(line)
             pattern = compact_to_pattern(compact)
             patterns.append(pattern)
         except Exception as e:
@@ -16,7 +16,7 @@ The CSV format balances human readability with data completeness by:
 import csv
 import json
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from universal_corpus.models import Pattern
 from universal_corpus.compact_format import pattern_to_compact
 
@@ -102,7 +102,7 @@ def pattern_to_csv_row(pattern: Pattern) -> Dict[str, str]:
     return row
 
 
-def patterns_to_csv(patterns: List[Pattern]) -> str:
+def patterns_to_csv(patterns: Iterable[Pattern]) -> str:
     """
     Export patterns to CSV format.
     
@@ -116,7 +116,7 @@ def patterns_to_csv(patterns: List[Pattern]) -> str:
     - Manifestations: manifestation names
     
     Args:
-        patterns: List of Pattern objects
+        patterns: Pattern objects (any iterable; consumed once)
         
     Returns:
         CSV string
@@ -262,7 +262,7 @@ def csv_to_patterns(csv_content: str) -> List[Pattern]:
     return patterns
 
 
-def patterns_to_csv_simple(patterns: List[Pattern]) -> str:
+def patterns_to_csv_simple(patterns: Iterable[Pattern]) -> str:
     """
     Export patterns to simplified CSV format (no detail columns).
     
@@ -270,7 +270,7 @@ def patterns_to_csv_simple(patterns: List[Pattern]) -> str:
     Best for quick overviews and stakeholder reviews.
     
     Args:
-        patterns: List of Pattern objects
+        patterns: Pattern objects (any iterable; consumed once)
         
     Returns:
         CSV string with simplified columns
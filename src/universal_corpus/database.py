@@ -7,10 +7,10 @@ This module provides:
 - CRUD operations with proper transaction handling
 """
 
-from sqlalchemy import create_engine, Column, String, Text, DateTime
+from sqlalchemy import create_engine, make_url, Column, String, Text, DateTime, func
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Iterator, Iterable, Set
 import json
 
 from universal_corpus.models import Pattern
@@ -19,12 +19,21 @@ from universal_corpus.models import Pattern
 # Database configuration
 SQLALCHEMY_DATABASE_URL = "sqlite:///./patterns.db"
 
+if make_url(SQLALCHEMY_DATABASE_URL).get_backend_name() == "sqlite":
+    # SQLite serializes writers on a file lock, so extra connections only add
+    # contention; keep SQLAlchemy's default pool (5 + 10 overflow)
+    _pool_options = {"connect_args": {"check_same_thread": False}}  # Needed for SQLite
+else:
+    # Sync endpoints run in a threadpool (40 workers by default); size the pool
+    # so concurrent requests wait on the database, not on a free connection
+    _pool_options = {"pool_size": 20, "max_overflow": 40}
+
 # Create engine with connection pooling
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
     pool_pre_ping=True,  # Enable connection health checks
-    echo=False  # Set to True for SQL debugging
+    echo=False,  # Set to True for SQL debugging
+    **_pool_options
 )
 
 # Create session factory
@@ -62,8 +71,8 @@ class PatternDB(Base):
     
     def to_pattern(self) -> Pattern:
         """Convert database model to Pydantic Pattern model."""
-        pattern_dict = json.loads(self.data)
-        return Pattern(**pattern_dict)
+        # Validate straight from the stored JSON; skips the intermediate dict
+        return Pattern.model_validate_json(self.data)
     
     @classmethod
     def from_pattern(cls, pattern: Pattern) -> "PatternDB":
@@ -137,7 +146,7 @@ class PatternRepository:
         Raises:
             ValueError: If pattern with same ID already exists
         """
-        existing = self.db.query(PatternDB).filter(PatternDB.id == pattern.id).first()
+        existing = self.db.get(PatternDB, pattern.id)
         if existing:
             raise ValueError(f"Pattern with ID '{pattern.id}' already exists")
         
@@ -157,9 +166,49 @@ class PatternRepository:
         Returns:
             Pattern if found, None otherwise
         """
-        db_pattern = self.db.query(PatternDB).filter(PatternDB.id == pattern_id).first()
+        db_pattern = self.db.get(PatternDB, pattern_id)
         return db_pattern.to_pattern() if db_pattern else None
     
+    def get_data(self, pattern_id: str) -> Optional[str]:
+        """
+        Retrieve the stored JSON document of a pattern without validating it.
+        
+        The document is a deterministic serialization of the pattern, so it
+        identifies the content cheaply: callers can key caches on it and only
+        build a Pattern when the cache misses.
+        
+        Args:
+            pattern_id: Pattern identifier
+            
+        Returns:
+            Stored JSON text if found, None otherwise
+        """
+        row = self.db.query(PatternDB.data).filter(PatternDB.id == pattern_id).first()
+        return row[0] if row else None
+    
+    def existing_ids(self, pattern_ids: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given pattern IDs are already stored.
+        
+        Looks the IDs up with IN queries over the primary key (in chunks that
+        stay under SQLite's bound-parameter limit) instead of one query and
+        one full deserialization per ID.
+        
+        Args:
+            pattern_ids: Pattern identifiers to check
+            
+        Returns:
+            Subset of pattern_ids present in the database
+        """
+        ids = list(dict.fromkeys(pattern_ids))
+        found: Set[str] = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            found.update(
+                row[0] for row in self.db.query(PatternDB.id).filter(PatternDB.id.in_(chunk))
+            )
+        return found
+    
     def list(
         self,
         category: Optional[str] = None,
@@ -179,15 +228,47 @@ class PatternRepository:
         Returns:
             List of patterns matching filters
         """
-        query = self.db.query(PatternDB)
+        # Only the JSON column is needed to rebuild a Pattern; selecting it alone
+        # skips ORM instance construction and identity-map bookkeeping per row
+        query = self.db.query(PatternDB.data)
+        
+        if category:
+            query = query.filter(PatternDB.category == category)
+        if status:
+            query = query.filter(PatternDB.status == status)
+        
+        rows = query.offset(offset).limit(limit).all()
+        return [Pattern.model_validate_json(data) for (data,) in rows]
+    
+    def iter(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        batch_size: int = 500
+    ) -> Iterator[Pattern]:
+        """
+        Iterate over all patterns matching the filters without loading them at once.
+        
+        Rows are fetched from the cursor in batches of batch_size, so memory use
+        stays bounded regardless of collection size.
+        
+        Args:
+            category: Filter by category
+            status: Filter by status
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Patterns matching filters
+        """
+        query = self.db.query(PatternDB.data)
         
         if category:
             query = query.filter(PatternDB.category == category)
         if status:
             query = query.filter(PatternDB.status == status)
         
-        db_patterns = query.offset(offset).limit(limit).all()
-        return [p.to_pattern() for p in db_patterns]
+        for (data,) in query.yield_per(batch_size):
+            yield Pattern.model_validate_json(data)
     
     def update(self, pattern_id: str, pattern: Pattern) -> Optional[Pattern]:
         """
@@ -206,7 +287,7 @@ class PatternRepository:
         if pattern.id != pattern_id:
             raise ValueError(f"Pattern ID mismatch: '{pattern_id}' != '{pattern.id}'")
         
-        db_pattern = self.db.query(PatternDB).filter(PatternDB.id == pattern_id).first()
+        db_pattern = self.db.get(PatternDB, pattern_id)
         if not db_pattern:
             return None
         
@@ -237,7 +318,7 @@ class PatternRepository:
         Returns:
             Updated pattern if found, None otherwise
         """
-        db_pattern = self.db.query(PatternDB).filter(PatternDB.id == pattern_id).first()
+        db_pattern = self.db.get(PatternDB, pattern_id)
         if not db_pattern:
             return None
         
@@ -401,7 +482,7 @@ class PatternRepository:
         Returns:
             True if deleted, False if not found
         """
-        db_pattern = self.db.query(PatternDB).filter(PatternDB.id == pattern_id).first()
+        db_pattern = self.db.get(PatternDB, pattern_id)
         if not db_pattern:
             return False
         
@@ -424,14 +505,16 @@ class PatternRepository:
         Returns:
             Number of patterns matching filters
         """
-        query = self.db.query(PatternDB)
+        # COUNT over the table directly; Query.count() wraps the full-row
+        # SELECT in a subquery
+        query = self.db.query(func.count(PatternDB.id))
         
         if category:
             query = query.filter(PatternDB.category == category)
         if status:
             query = query.filter(PatternDB.status == status)
         
-        return query.count()
+        return query.scalar()
     
     def get_statistics(self) -> dict:
         """
@@ -440,28 +523,19 @@ class PatternRepository:
         Returns:
             Dictionary with counts by category, status, and complexity
         """
-        total = self.db.query(PatternDB).count()
-        
-        # Count by category
-        by_category = {}
-        for category in ["concept", "pattern", "flow"]:
-            count = self.db.query(PatternDB).filter(PatternDB.category == category).count()
-            if count > 0:
-                by_category[category] = count
-        
-        # Count by status
-        by_status = {}
-        for status in ["draft", "stable", "deprecated"]:
-            count = self.db.query(PatternDB).filter(PatternDB.status == status).count()
-            if count > 0:
-                by_status[status] = count
-        
-        # Count by complexity
-        by_complexity = {}
-        for complexity in ["low", "medium", "high"]:
-            count = self.db.query(PatternDB).filter(PatternDB.complexity == complexity).count()
-            if count > 0:
-                by_complexity[complexity] = count
+        # One GROUP BY per dimension instead of a COUNT query per value;
+        # keys keep the schema's enumeration order
+        category_counts = self._group_counts(PatternDB.category)
+        by_category = self._known_counts(category_counts, ["concept", "pattern", "flow"])
+        by_status = self._known_counts(
+            self._group_counts(PatternDB.status), ["draft", "stable", "deprecated"]
+        )
+        by_complexity = self._known_counts(
+            self._group_counts(PatternDB.complexity), ["low", "medium", "high"]
+        )
+        
+        # category is NOT NULL, so its groups partition the table
+        total = sum(category_counts.values())
         
         return {
             "total_patterns": total,
@@ -469,3 +543,31 @@ class PatternRepository:
             "by_status": by_status,
             "by_complexity": by_complexity
         }
+    
+    def _group_counts(self, column) -> dict:
+        """
+        Count patterns grouped by a column.
+        
+        Args:
+            column: PatternDB column to group on
+            
+        Returns:
+            Dictionary of column value to count
+        """
+        return dict(
+            self.db.query(column, func.count(PatternDB.id)).group_by(column).all()
+        )
+    
+    @staticmethod
+    def _known_counts(counts: dict, values: List[str]) -> dict:
+        """
+        Select the counts for known values, in order.
+        
+        Args:
+            counts: Grouped counts from _group_counts
+            values: Known values to report, in output order
+            
+        Returns:
+            Dictionary of value to count, omitting values with no patterns
+        """
+        return {value: counts[value] for value in values if counts.get(value)}
@@ -15,6 +15,10 @@ CategoryType = Literal["concept", "pattern", "flow"]
 StatusType = Literal["draft", "stable", "deprecated"]
 ComplexityType = Literal["low", "medium", "high"]
 
+# Compiled once; validators run for every pattern and every pattern reference
+ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+PATTERN_ID_RE = re.compile(r'^[CPF][0-9]+(\.[0-9]+)?$')
+
 
 class MathExpression(BaseModel):
     """Mathematical expression with optional format specification (defaults to latex)."""
@@ -46,7 +50,7 @@ class Metadata(BaseModel):
     def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
         """Validate that last_updated is in ISO date format (YYYY-MM-DD)."""
         if v is not None:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', v):
+            if not ISO_DATE_RE.match(v):
                 raise ValueError('last_updated must be in ISO date format (YYYY-MM-DD)')
         return v
 
@@ -182,9 +186,8 @@ class PatternRefs(BaseModel):
     @classmethod
     def validate_pattern_ids(cls, v: List[str]) -> List[str]:
         """Validate that pattern references match the PatternIdType pattern."""
-        pattern = re.compile(r'^[CPF][0-9]+(\.[0-9]+)?$')
         for ref in v:
-            if not pattern.match(ref):
+            if not PATTERN_ID_RE.match(ref):
                 raise ValueError(f'Pattern ID "{ref}" must match pattern [CPF][0-9]+(.[0-9]+)?')
         return v
     
@@ -237,7 +240,7 @@ class Pattern(BaseModel):
     @classmethod
     def validate_pattern_id(cls, v: str) -> str:
         """Validate that id matches the PatternIdType pattern: [CPF][0-9]+(.[0-9]+)?"""
-        if not re.match(r'^[CPF][0-9]+(\.[0-9]+)?$', v):
+        if not PATTERN_ID_RE.match(v):
             raise ValueError('Pattern ID must match pattern [CPF][0-9]+(.[0-9]+)?')
         return v
     
@@ -8,6 +8,8 @@ Following TDD principles, these tests validate:
 4. Edge cases and error handling
 """
 
+import hashlib
+import json
 import pytest
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
@@ -21,7 +23,8 @@ from universal_corpus.models import (
     Properties, Property, Operations, Operation, Manifestations, Manifestation,
     Dependencies, PatternRefs, TypeDefinitions, TypeDef
 )
-from universal_corpus.database import Base, get_db
+from universal_corpus.database import Base, PatternRepository, get_db
+from universal_corpus.cache import ResponseCache, response_cache
 
 
 # Create test database engine
@@ -50,6 +53,7 @@ app.dependency_overrides[get_db] = override_get_db
 def setup_database():
     """Create fresh database for each test."""
     Base.metadata.create_all(bind=test_engine)
+    response_cache.clear()
     yield
     Base.metadata.drop_all(bind=test_engine)
 
@@ -358,6 +362,12 @@ class TestRootEndpoint:
         data = response.json()
         assert data["status"] == "healthy"
         assert "patterns_count" in data
+    
+    def test_health_count_tracks_writes(self, client, valid_pattern_data):
+        """Test that the cached pattern count is refreshed after a write."""
+        assert client.get("/health").json()["patterns_count"] == 0
+        client.post("/patterns", json=valid_pattern_data)
+        assert client.get("/health").json()["patterns_count"] == 1
 
 
 class TestCreatePattern:
@@ -446,6 +456,61 @@ class TestListPatterns:
         response = client.get("/patterns?limit=2&offset=2")
         assert response.status_code == 200
         assert len(response.json()) == 2
+    
+    def test_list_patterns_gzip(self, client, valid_pattern_data):
+        """Test that large listings are compressed when the client accepts gzip."""
+        for i in range(5):
+            data = valid_pattern_data.copy()
+            data["id"] = f"C{i}"
+            client.post("/patterns", json=data)
+        
+        response = client.get("/patterns", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 5
+        
+        response = client.get("/patterns", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+    
+    def test_list_cache_invalidated_on_write(self, client, valid_pattern_data):
+        """Test that cached listings are dropped when a pattern is created or deleted."""
+        assert client.get("/patterns").json() == []
+        
+        client.post("/patterns", json=valid_pattern_data)
+        assert len(client.get("/patterns").json()) == 1
+        
+        client.delete(f"/patterns/{valid_pattern_data['id']}")
+        assert client.get("/patterns").json() == []
+
+
+class TestResponseCache:
+    """Test the in-process response cache."""
+    
+    def test_response_cache_serves_stale_on_db_error(self):
+        """Test that an expired entry is served when recomputation hits a DB error."""
+        from sqlalchemy.exc import OperationalError
+        
+        cache = ResponseCache()
+        assert cache.get_or_compute(("patterns",), 0, lambda: ["cached"]) == ["cached"]
+        
+        def failing():
+            raise OperationalError("SELECT 1", {}, Exception("database is locked"))
+        
+        assert cache.get_or_compute(("patterns",), 0, failing) == ["cached"]
+        with pytest.raises(OperationalError):
+            cache.get_or_compute(("patterns",), 0, failing, stale_on_error=False)
+    
+    def test_response_cache_evicts_least_recently_used(self):
+        """Test that a hit protects an entry from eviction."""
+        cache = ResponseCache(max_entries=2)
+        cache.get_or_compute(("a",), 60, lambda: "a")
+        cache.get_or_compute(("b",), 60, lambda: "b")
+        
+        # Touch "a" so that "b" is the least recently used entry
+        assert cache.get_or_compute(("a",), 60, lambda: "recomputed") == "a"
+        cache.get_or_compute(("c",), 60, lambda: "c")
+        
+        assert cache.get_or_compute(("a",), 60, lambda: "recomputed") == "a"
+        assert cache.get_or_compute(("b",), 60, lambda: "recomputed") == "recomputed"
 
 
 class TestGetPattern:
@@ -464,6 +529,56 @@ class TestGetPattern:
         response = client.get("/patterns/NONEXISTENT")
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
+    
+    def test_conditional_get_returns_304(self, client, valid_pattern_data):
+        """Test that a matching If-None-Match header yields 304 without a body."""
+        client.post("/patterns", json=valid_pattern_data)
+        response = client.get(f"/patterns/{valid_pattern_data['id']}")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=10"
+        
+        for path in (f"/patterns/{valid_pattern_data['id']}",
+                     f"/patterns/{valid_pattern_data['id']}/xml"):
+            response = client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+            
+            response = client.get(path, headers={"If-None-Match": f'W/"0.0.0", {etag}'})
+            assert response.status_code == 304
+            
+            response = client.get(path, headers={"If-None-Match": "*"})
+            assert response.status_code == 304
+            
+            response = client.get(path, headers={"If-None-Match": 'W/"0.0.0"'})
+            assert response.status_code == 200
+    
+    def test_conditional_get_after_update_returns_200(self, client, valid_pattern_data):
+        """Test that an update without a version bump changes the ETag."""
+        client.post("/patterns", json=valid_pattern_data)
+        path = f"/patterns/{valid_pattern_data['id']}"
+        etag = client.get(path).headers["etag"]
+        
+        valid_pattern_data["metadata"]["name"] = "Renamed Graph"
+        client.put(path, json=valid_pattern_data)
+        
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["metadata"]["name"] == "Renamed Graph"
+        assert response.headers["etag"] != etag
+        
+        response = client.get(f"{path}/xml", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    
+    def test_etag_is_digest_of_body(self, client, valid_pattern_data):
+        """Test that the ETag hashes the body bytes and is shared with cached XML."""
+        client.post("/patterns", json=valid_pattern_data)
+        path = f"/patterns/{valid_pattern_data['id']}"
+        response = client.get(path)
+        
+        digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        assert response.headers["etag"] == f'W/"{digest}"'
+        for _ in range(2):
+            assert client.get(f"{path}/xml").headers["etag"] == response.headers["etag"]
 
 
 class TestGetPatternXML:
@@ -492,6 +607,90 @@ class TestGetPatternXML:
         assert root.find(".//{http://universal-corpus.org/schema/v1}definition") is not None
         assert root.find(".//{http://universal-corpus.org/schema/v1}properties") is not None
         assert root.find(".//{http://universal-corpus.org/schema/v1}operations") is not None
+    
+    def test_xml_escapes_special_characters(self, client, valid_pattern_data):
+        """Test that markup characters in values round-trip through the XML."""
+        valid_pattern_data["metadata"]["name"] = 'Graph <G> & "Edges"'
+        client.post("/patterns", json=valid_pattern_data)
+        response = client.get(f"/patterns/{valid_pattern_data['id']}/xml")
+        assert response.status_code == 200
+        
+        root = ET.fromstring(response.content)
+        name = root.find("{http://universal-corpus.org/schema/v1}metadata/"
+                         "{http://universal-corpus.org/schema/v1}name")
+        assert name.text == 'Graph <G> & "Edges"'
+    
+    def test_xml_reflects_update_without_version_bump(self, client, valid_pattern_data):
+        """Test that cached XML is invalidated when a pattern is updated."""
+        client.post("/patterns", json=valid_pattern_data)
+        response = client.get(f"/patterns/{valid_pattern_data['id']}/xml")
+        assert "Graph Structure" in response.text
+        
+        valid_pattern_data["metadata"]["name"] = "Renamed Graph"
+        client.put(f"/patterns/{valid_pattern_data['id']}", json=valid_pattern_data)
+        response = client.get(f"/patterns/{valid_pattern_data['id']}/xml")
+        assert "Renamed Graph" in response.text
+        assert "Graph Structure" not in response.text
+    
+    def test_xml_reflects_direct_database_write(self, client, valid_pattern_data):
+        """Test that cached XML follows a write made outside the API, as the CLI does."""
+        client.post("/patterns", json=valid_pattern_data)
+        response = client.get(f"/patterns/{valid_pattern_data['id']}/xml")
+        assert "Graph Structure" in response.text
+        
+        valid_pattern_data["metadata"]["name"] = "Renamed Graph"
+        db = TestSessionLocal()
+        try:
+            PatternRepository(db).update(valid_pattern_data["id"], Pattern(**valid_pattern_data))
+        finally:
+            db.close()
+        response = client.get(f"/patterns/{valid_pattern_data['id']}/xml")
+        assert "Renamed Graph" in response.text
+        assert "Graph Structure" not in response.text
+
+
+class TestStreamPatternsXML:
+    """Test streaming XML export of the whole collection."""
+    
+    def test_stream_patterns_xml(self, client, valid_pattern_data):
+        """Test that every pattern is streamed under a single root element."""
+        for i in range(3):
+            data = valid_pattern_data.copy()
+            data["id"] = f"C{i}"
+            client.post("/patterns", json=data)
+        
+        response = client.get("/patterns.xml")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/xml")
+        
+        ns = "{http://universal-corpus.org/schema/v1}"
+        root = ET.fromstring(response.content)
+        assert root.tag == f"{ns}patterns"
+        assert sorted(p.get("id") for p in root.findall(f"{ns}pattern")) == ["C0", "C1", "C2"]
+    
+    def test_render_many_xml_chunks_match_stream(self, client, valid_pattern_data):
+        """Test that small chunks join into the same document as the stream."""
+        from universal_corpus.api import render_many_xml
+        
+        patterns = []
+        for i in range(3):
+            data = valid_pattern_data.copy()
+            data["id"] = f"C{i}"
+            client.post("/patterns", json=data)
+            patterns.append(Pattern(**data))
+        response = client.get("/patterns.xml")
+        
+        chunks = list(render_many_xml(patterns, chunk_size=1))
+        assert len(chunks) == 4
+        assert "".join(chunks) == response.text
+    
+    def test_stream_patterns_xml_filtered(self, client, valid_pattern_data):
+        """Test that filters apply to the streamed collection."""
+        client.post("/patterns", json=valid_pattern_data)
+        
+        response = client.get("/patterns.xml?category=flow")
+        root = ET.fromstring(response.content)
+        assert len(root) == 0
 
 
 class TestUpdatePattern:
@@ -576,6 +775,19 @@ class TestPartialUpdatePattern:
         formal_definition = op.get("formal-definition") or op.get("formal_definition")
         assert formal_definition is not None
 
+    def test_partial_update_rejects_malformed_body(self, client, valid_pattern_data):
+        """Test that non-JSON and non-object bodies are rejected with 422."""
+        client.post("/patterns", json=valid_pattern_data)
+        url = f"/patterns/{valid_pattern_data['id']}"
+
+        response = client.patch(url, content=b"{not json", headers={"Content-Type": "application/json"})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+        response = client.patch(url, json=["metadata"])
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "dict_type"
+
 
 class TestDeletePattern:
     """Test pattern deletion endpoint."""
@@ -652,6 +864,18 @@ class TestStatisticsEndpoint:
         assert data["by_category"]["concept"] == 1
         assert data["by_category"]["pattern"] == 1
         assert data["by_category"]["flow"] == 1
+    
+    def test_statistics_omits_empty_groups(self, client, valid_pattern_data):
+        """Test that grouped counts only report values that occur."""
+        for i, status in enumerate(["draft", "draft", "stable"]):
+            data = valid_pattern_data.copy()
+            data["id"] = f"C{i}"
+            data["metadata"] = dict(valid_pattern_data["metadata"], status=status)
+            client.post("/patterns", json=data)
+        
+        data = client.get("/statistics").json()
+        assert data["by_status"] == {"draft": 2, "stable": 1}
+        assert data["by_category"] == {valid_pattern_data["metadata"]["category"]: 3}
 
 
 class TestCSVExportEndpoint:
@@ -837,6 +1061,46 @@ class TestCSVExportEndpoint:
         # Verify detailed operation information is present
         assert "Traverse" in data_row  # Operation name
         assert "[sig:" in data_row  # Operation signature marker
+    
+    def test_export_jsonl_streams_all_patterns(self, client, valid_pattern_data):
+        """Test that the JSONL export streams one line per stored pattern."""
+        for i in range(3):
+            data = valid_pattern_data.copy()
+            data["id"] = f"C{i}"
+            client.post("/patterns", json=data)
+        
+        response = client.get("/export/jsonl")
+        assert response.status_code == 200
+        ids = sorted(json.loads(line)["id"] for line in response.text.splitlines())
+        assert ids == ["C0", "C1", "C2"]
+
+
+class TestImportEndpoints:
+    """Test bulk import endpoints."""
+    
+    def test_import_jsonl_skips_existing_and_duplicates(self, client, valid_pattern_data):
+        """Test that stored and repeated IDs are skipped and bad lines reported."""
+        client.post("/patterns", json=valid_pattern_data)
+        
+        new_pattern = dict(valid_pattern_data, id="C7")
+        content = "\n".join([
+            json.dumps(valid_pattern_data),
+            json.dumps(new_pattern),
+            json.dumps(new_pattern),
+            "{not json"
+        ])
+        response = client.post(
+            "/import/jsonl",
+            files={"file": ("patterns.jsonl", content, "application/x-ndjson")}
+        )
+        assert response.status_code == 200
+        stats = response.json()["statistics"]
+        assert stats["total"] == 4
+        assert stats["imported"] == 1
+        assert stats["skipped"] == 2
+        assert stats["failed"] == 1
+        assert stats["errors"][0]["line"] == 4
+        assert client.get("/patterns/C7").status_code == 200
 
 
 # ==================== Integration Tests ====================
@@ -0,0 +1,247 @@
+"""
+Tests for the XML master-data corpus manager.
+"""
+
+import csv
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from universal_corpus.cli.corpus_manager import (
+    CorpusManager, Component, Dependencies, Manifestation, Operation, Pattern, Property,
+    XMLParser
+)
+
+
+def make_manager(graph):
+    """Build a manager whose patterns require each other as given by graph."""
+    manager = CorpusManager()
+    for pattern_id, requires in graph.items():
+        manager.patterns[pattern_id] = Pattern(
+            id=pattern_id,
+            version="1.0",
+            name=f"Pattern {pattern_id}",
+            category="pattern",
+            dependencies=Dependencies(requires=list(requires))
+        )
+    return manager
+
+
+def read_csv(path):
+    """Read an exported CSV file into a list of row dicts."""
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def cycle_members(cycles):
+    """Collect every pattern that appears on a reported chain."""
+    return {pattern_id for cycle in cycles for pattern_id in cycle}
+
+
+class TestFindCircularDependencies:
+    """Test dependency cycle reporting."""
+    
+    def test_self_loop(self):
+        """Test that a pattern depending on itself is reported."""
+        manager = make_manager({"P1": ["P1"], "P2": ["P1"]})
+        assert manager.find_circular_dependencies() == [["P1", "P1"]]
+    
+    def test_self_loop_inside_larger_component(self):
+        """Test that every member of a component with a self-loop is reported."""
+        manager = make_manager({
+            "P1": ["P1", "P6", "P4"],
+            "P4": ["P6"],
+            "P5": ["P1"],
+            "P6": ["P5", "P7"],
+            "P7": ["P6"],
+            "P8": ["P1"]
+        })
+        cycles = manager.find_circular_dependencies()
+        
+        assert cycles[0] == ["P1", "P1"]
+        assert cycle_members(cycles) == {"P1", "P4", "P5", "P6", "P7"}
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+            for source, target in zip(cycle, cycle[1:]):
+                assert target in manager.patterns[source].dependencies.requires
+    
+    def test_two_disjoint_cycles(self):
+        """Test that separate cycles are each reported once, in pattern order."""
+        manager = make_manager({
+            "P1": ["P2"],
+            "P2": ["P3"],
+            "P3": ["P1"],
+            "P10": ["P11"],
+            "P11": ["P10"],
+            "P12": ["P10"]
+        })
+        assert manager.find_circular_dependencies() == [
+            ["P1", "P2", "P3", "P1"],
+            ["P10", "P11", "P10"]
+        ]
+    
+    def test_acyclic_graph(self):
+        """Test that a graph without cycles reports none."""
+        manager = make_manager({"P1": ["P2", "P3"], "P2": ["P3"], "P3": ["P404"]})
+        assert manager.find_circular_dependencies() == []
+    
+    def test_reflects_changes_to_patterns(self):
+        """Test that patterns added or edited between calls are taken into account."""
+        manager = make_manager({"P1": ["P2"]})
+        assert manager.find_circular_dependencies() == []
+        
+        manager.patterns["P2"] = make_manager({"P2": ["P1"]}).patterns["P2"]
+        assert manager.find_circular_dependencies() == [["P1", "P2", "P1"]]
+        
+        manager.patterns["P2"].dependencies.requires.clear()
+        assert manager.find_circular_dependencies() == []
+
+
+class TestSortedPatternIds:
+    """Test the numeric ordering shared by list_patterns and the exports."""
+    
+    def test_reflects_patterns_added_between_calls(self, tmp_path):
+        """Test that patterns added to the dict after an export are ordered too."""
+        manager = make_manager({"P10": [], "C2": []})
+        assert manager.list_patterns() == ["C2", "P10"]
+        
+        manager.patterns.update(make_manager({"P9": [], "C1": [], "F1.1": []}).patterns)
+        assert manager.list_patterns() == ["C1", "C2", "F1.1", "P9", "P10"]
+        assert manager.list_patterns("P") == ["P9", "P10"]
+        
+        output_path = tmp_path / "summary.csv"
+        manager.export_to_csv_summary(output_path)
+        assert [row["id"] for row in read_csv(output_path)] == ["C1", "F1.1", "C2", "P9", "P10"]
+
+
+class TestCircularFlags:
+    """Test how the CSV exports mark patterns and edges on dependency cycles."""
+    
+    GRAPH = {
+        "P1": ["P2"],
+        "P2": ["P3"],
+        "P3": ["P1", "P2"],
+        "P4": ["P1"],
+        "P5": ["P6"],
+        "P6": ["P5"],
+        "P7": ["P7"]
+    }
+    
+    def test_component_ids(self):
+        """Test that members share an id within a component and differ across components."""
+        component_of = make_manager(self.GRAPH)._circular_component_ids()
+        
+        assert set(component_of) == {"P1", "P2", "P3", "P5", "P6", "P7"}
+        assert component_of["P1"] == component_of["P2"] == component_of["P3"]
+        assert component_of["P5"] == component_of["P6"]
+        assert len({component_of["P1"], component_of["P5"], component_of["P7"]}) == 3
+    
+    def test_summary_marks_component_members(self, tmp_path):
+        """Test that has_circular_deps is set for every member of a cyclic component."""
+        output_path = tmp_path / "summary.csv"
+        make_manager(self.GRAPH).export_to_csv_summary(output_path)
+        
+        flags = {row["id"]: row["has_circular_deps"] for row in read_csv(output_path)}
+        assert flags == {
+            "P1": "yes", "P2": "yes", "P3": "yes", "P4": "no",
+            "P5": "yes", "P6": "yes", "P7": "yes"
+        }
+    
+    def test_dependencies_mark_edges_within_a_component(self, tmp_path):
+        """Test that an edge is circular only when both ends share a component."""
+        manager = make_manager(self.GRAPH)
+        manager.patterns["P5"].dependencies.uses = ["P1"]
+        # specialized-by is not part of the dependency graph, so this pair is
+        # not an edge even though both ends share a component
+        manager.patterns["P2"].dependencies.specialized_by = ["P1"]
+        output_path = tmp_path / "dependencies.csv"
+        manager.export_to_csv_dependencies(output_path)
+        
+        flags = {
+            (row["source_id"], row["target_id"], row["relationship_type"]): row["is_circular"]
+            for row in read_csv(output_path)
+        }
+        assert flags == {
+            ("P1", "P2", "requires"): "yes",
+            ("P2", "P3", "requires"): "yes",
+            ("P2", "P1", "specialized_by"): "no",
+            ("P3", "P1", "requires"): "yes",
+            ("P3", "P2", "requires"): "yes",
+            ("P4", "P1", "requires"): "no",
+            ("P5", "P6", "requires"): "yes",
+            ("P5", "P1", "uses"): "no",
+            ("P6", "P5", "requires"): "yes",
+            ("P7", "P7", "requires"): "yes"
+        }
+
+
+class TestLoadFromXmlDirectory:
+    """Test loading a directory of pattern files."""
+    
+    @pytest.fixture
+    def xml_dir(self, tmp_path):
+        """Write a few pattern files and one malformed file."""
+        manager = make_manager({"P1": ["P2"], "P2": [], "C1": ["P1"], "F1.1": ["C1"]})
+        for pattern_id, pattern in manager.patterns.items():
+            (tmp_path / f"{pattern_id}.xml").write_text(
+                manager._pattern_to_xml(pattern), encoding='utf-8'
+            )
+        (tmp_path / "P3.xml").write_text("<pattern id='P3'><metadata>", encoding='utf-8')
+        return tmp_path
+    
+    def test_parallel_load_matches_serial(self, xml_dir, capsys):
+        """Test that worker processes load the same patterns and report the same errors."""
+        serial = CorpusManager()
+        serial.load_from_xml_directory(xml_dir, workers=1)
+        serial_errors = capsys.readouterr().err
+        
+        parallel = CorpusManager()
+        parallel.load_from_xml_directory(xml_dir, workers=2)
+        parallel_errors = capsys.readouterr().err
+        
+        assert sorted(serial.patterns) == ["C1", "F1.1", "P1", "P2"]
+        assert list(parallel.patterns) == list(serial.patterns)
+        assert parallel.patterns == serial.patterns
+        assert "Failed to parse P3.xml" in serial_errors
+        assert parallel_errors == serial_errors
+    
+    def test_parallel_load_shares_interned_ids(self, xml_dir):
+        """Test that IDs and pattern-refs returned by workers are interned again."""
+        manager = CorpusManager()
+        manager.load_from_xml_directory(xml_dir, workers=2)
+        
+        assert manager.patterns["P1"].dependencies.requires[0] is sys.intern("P2")
+        for pattern_id in manager.patterns:
+            assert pattern_id is sys.intern(pattern_id)
+
+
+class TestUnifiedCorpusXml:
+    """Test the single-file corpus export."""
+    
+    NS = "{http://universal-corpus.org/schema/v1}"
+    
+    def test_round_trip(self, tmp_path):
+        """Test that every exported pattern parses back to the original."""
+        manager = make_manager({"P3": ["P2"], "P2": [], "C1": ["P2", "P3"]})
+        pattern = manager.patterns["P2"]
+        pattern.domains = ["Graph Theory", "Data & Structures"]
+        pattern.tuple_notation = "$G = (N, E)$"
+        pattern.components = [Component("N", "Set⟨Node⟩", "N", "set of <nodes>")]
+        pattern.properties = [Property("P.P2.1", "Connectivity", "∀n ∈ N: reachable(n)")]
+        pattern.operations = [Operation("traverse", "traverse(n: N) → Set⟨N⟩", "BFS from n")]
+        pattern.manifestations = [Manifestation("Social graph", "Friends of friends")]
+        output_path = tmp_path / "corpus.xml"
+        manager.export_unified_corpus_xml(output_path)
+        
+        content = output_path.read_text(encoding="utf-8")
+        assert content.startswith('<?xml version="1.0" ?>\n<corpus ')
+        assert "ns0:" not in content
+        assert all(line.strip() for line in content.splitlines())
+        
+        root = ET.fromstring(content)
+        assert root.find(f"{self.NS}metadata/{self.NS}total-patterns").text == "3"
+        elements = root.findall(f"{self.NS}patterns/{self.NS}pattern")
+        assert [element.get("id") for element in elements] == ["C1", "P2", "P3"]
+        for element in elements:
+            assert XMLParser._parse_root(element) == manager.patterns[element.get("id")]
@@ -0,0 +1,114 @@
+"""
+Tests for the pattern management CLI.
+"""
+
+import json
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from universal_corpus.cli import pattern_cli
+from universal_corpus.cli.pattern_cli import PatternCLI
+from universal_corpus.database import Base, PatternRepository
+from universal_corpus.models import Pattern
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    """Create a CLI bound to a throwaway SQLite database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'cli.db'}")
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(pattern_cli, "SessionLocal", sessionmaker(bind=engine))
+    with PatternCLI() as cli:
+        yield cli
+    engine.dispose()
+
+
+@pytest.fixture
+def stored_pattern(cli):
+    """Store a pattern with non-ASCII text through the CLI's repository."""
+    pattern = Pattern(**{
+        "id": "C1",
+        "version": "1.1",
+        "metadata": {
+            "name": "Graph Structure – Überblick",
+            "category": "concept",
+            "status": "stable"
+        },
+        "definition": {
+            "tuple-notation": {"content": "$G = (N, E)$", "format": "latex"},
+            "components": {
+                "component": [
+                    {"name": "N", "type": "Set⟨Node⟩", "description": "Set of nodes"}
+                ]
+            }
+        },
+        "properties": {
+            "property": [
+                {
+                    "id": "P.C1.1",
+                    "name": "Connectivity",
+                    "formal-spec": {"content": "∀n₁, n₂ ∈ N: ∃ path", "format": "latex"}
+                }
+            ]
+        },
+        "operations": {
+            "operation": [
+                {
+                    "name": "Traverse",
+                    "signature": "traverse(n: N) → Set⟨N⟩",
+                    "formal-definition": {"content": "traverse(n) = {n}", "format": "latex"}
+                }
+            ]
+        }
+    })
+    PatternRepository(cli.db).create(pattern)
+    return pattern
+
+
+class TestExportAll:
+    """Test bulk export to JSON and JSONL files."""
+    
+    def test_export_json_keeps_unicode_and_indentation(self, cli, stored_pattern, tmp_path):
+        """Test that JSON export writes raw UTF-8 with two-space indentation."""
+        output_file = tmp_path / "patterns.json"
+        assert cli.export_all(str(output_file), format="json") == 0
+        
+        content = output_file.read_text(encoding="utf-8")
+        expected = [stored_pattern.model_dump()]
+        assert content == json.dumps(expected, indent=2, ensure_ascii=False)
+        assert "Überblick" in content
+        assert "\\u" not in content
+    
+    def test_export_json_streams_several_patterns(self, cli, stored_pattern, tmp_path):
+        """Test that a streamed JSON array matches json.dumps for several patterns."""
+        second = stored_pattern.model_copy(update={"id": "C2"})
+        PatternRepository(cli.db).create(second)
+        output_file = tmp_path / "patterns.json"
+        assert cli.export_all(str(output_file), format="json") == 0
+        
+        content = output_file.read_text(encoding="utf-8")
+        expected = [stored_pattern.model_dump(), second.model_dump()]
+        assert content == json.dumps(expected, indent=2, ensure_ascii=False)
+    
+    def test_export_json_empty(self, cli, tmp_path):
+        """Test that an empty database exports an empty JSON array."""
+        output_file = tmp_path / "patterns.json"
+        assert cli.export_all(str(output_file), format="json") == 0
+        assert output_file.read_text(encoding="utf-8") == json.dumps([], indent=2)
+    
+    def test_export_jsonl_writes_one_pattern_per_line(self, cli, stored_pattern, tmp_path):
+        """Test that JSONL export writes one UTF-8 object per line."""
+        output_file = tmp_path / "patterns.jsonl"
+        assert cli.export_all(str(output_file), format="jsonl") == 0
+        
+        content = output_file.read_text(encoding="utf-8")
+        assert content.endswith("\n")
+        lines = content.splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == stored_pattern.model_dump()
+        assert "traverse(n: N) → Set⟨N⟩" in lines[0]
+    
+    def test_export_unknown_format(self, cli, stored_pattern, tmp_path):
+        """Test that an unknown format is rejected."""
+        assert cli.export_all(str(tmp_path / "patterns.txt"), format="xml") == 1